@@ -1,11 +1,141 @@
 import json
+import logging
 import os
+import reprlib
+import socket
+import types
 import urllib3
 
-http = urllib3.PoolManager()
+logger = logging.getLogger()
+# An unknown LOG_LEVEL falls back to WARNING instead of failing at import.
+_LOG_LEVEL = logging.getLevelName(os.environ.get("LOG_LEVEL", "WARNING").upper())
+logger.setLevel(_LOG_LEVEL if isinstance(_LOG_LEVEL, int) else logging.WARNING)
+
+# At DEBUG level each incoming event is logged through a bounded repr, so large
+# headers or bodies can't blow up the log line.
+_event_repr = reprlib.Repr()
+_event_repr.maxdict = 50
+_event_repr.maxstring = 500
+_event_repr.maxother = 500
+
+try:
+    import orjson
+except ImportError:  # orjson is not in the base Lambda runtime
+    orjson = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+# Opt-in binary wire format for the upstream POST. The Sophia API is only
+# known to speak JSON, so JSON stays the default; set SOPHIA_WIRE=cbor to try
+# CBOR against an upstream that accepts application/cbor.
+WIRE_CBOR = os.environ.get("SOPHIA_WIRE", "json").lower() == "cbor" and cbor2 is not None
+WIRE_CONTENT_TYPE = "application/cbor" if WIRE_CBOR else "application/json"
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(data):
+    """Parse JSON from str or bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 API_URL = "https://api-prod-0.sophia-app.com/api/services/search/keyword-search"
 
+# Everything below is invariant for the life of the container, so it is built
+# once at init and reused by every warm invocation.
+_API = urllib3.util.parse_url(API_URL)
+# One host, one POST per invocation: a small pool of persistent connections is
+# enough, and block=False lets a burst open an extra socket instead of waiting.
+_POOL = urllib3.HTTPSConnectionPool(_API.host, port=_API.port or 443, maxsize=4, block=False)
+_TIMEOUT = urllib3.Timeout(connect=5.0, read=25.0)
+
+TENANT = os.environ.get("SOPHIA_TENANT", "sc-prod-0")
+ORIGIN = os.environ.get("SOPHIA_ORIGIN", "https://www.sc211.org")
+
+# Shared by every invocation, so expose it read-only.
+_HEADERS = types.MappingProxyType({
+    "Accept": WIRE_CONTENT_TYPE,
+    "Content-Type": WIRE_CONTENT_TYPE,
+    "Tenant": TENANT,
+    "Origin": ORIGIN,
+    # Keep the TLS connection in _POOL open across warm invocations.
+    "Connection": "keep-alive",
+    # Optional but sometimes helpful:
+    # "Referer": ORIGIN + "/",
+    # If the API truly requires cookies (often it doesn't for pure API calls), add:
+    # "Cookie": os.environ.get("SOPHIA_COOKIE", ""),
+})
+
+
+def _warm_up():
+    """Resolve DNS and open the TLS connection during the INIT phase.
+
+    Opt-in (SOPHIA_WARMUP=1) because it sends an extra OPTIONS request to the
+    upstream from every new container. Best-effort: any failure just leaves
+    the pool cold.
+    """
+    try:
+        socket.getaddrinfo(_API.host, _API.port or 443, type=socket.SOCK_STREAM)
+        _POOL.urlopen(
+            "OPTIONS",
+            _API.request_uri,
+            headers=_HEADERS,
+            timeout=urllib3.Timeout(connect=2.0, read=2.0),
+            retries=False,
+        )
+    except Exception:
+        logger.debug("Upstream warm-up failed", exc_info=True)
+
+
+if os.environ.get("SOPHIA_WARMUP") == "1":
+    _warm_up()
+
+# filterButtons never change between requests — build them once per container
+# instead of on every invocation. Tuples so nothing can mutate the shared copy.
+_STATIC_FILTER_BUTTONS = (
+    {
+        "name": "languages",
+        "label": "Languages Offered",
+        "insideShowMoreFilters": False,
+        "displayOrder": 1,
+        "aggregationDetails": (
+            {
+                "aggregationName": "serviceLanguages",
+                "fieldToSearch": "service.languages.languageName.keyword"
+            },
+            {
+                "aggregationName": "locationLanguages",
+                "fieldToSearch": "location.languages.languageName.keyword"
+            }
+        ),
+        "excludeInOptions": ("No additional information provided",)
+    },
+    {
+        "name": "feeType",
+        "label": "Fee Type",
+        "insideShowMoreFilters": False,
+        "displayOrder": 3,
+        "aggregationDetails": (
+            {
+                "aggregationName": "feeType",
+                "fieldToSearch": "service.feeType.name.keyword"
+            },
+        ),
+        "excludeInOptions": ()
+    },
+)
+
+
 def build_payload(
     phrase: str,
     latitude: float,
@@ -25,47 +155,33 @@ def build_payload(
             },
             "order": "relevance",
             "filtersApplied": [],
-            "filterButtons": [
-                {
-                    "name": "languages",
-                    "label": "Languages Offered",
-                    "insideShowMoreFilters": False,
-                    "displayOrder": 1,
-                    "aggregationDetails": [
-                        {
-                            "aggregationName": "serviceLanguages",
-                            "fieldToSearch": "service.languages.languageName.keyword"
-                        },
-                        {
-                            "aggregationName": "locationLanguages",
-                            "fieldToSearch": "location.languages.languageName.keyword"
-                        }
-                    ],
-                    "excludeInOptions": ["No additional information provided"]
-                },
-                {
-                    "name": "feeType",
-                    "label": "Fee Type",
-                    "insideShowMoreFilters": False,
-                    "displayOrder": 3,
-                    "aggregationDetails": [
-                        {
-                            "aggregationName": "feeType",
-                            "fieldToSearch": "service.feeType.name.keyword"
-                        }
-                    ],
-                    "excludeInOptions": []
-                }
-            ]
+            "filterButtons": _STATIC_FILTER_BUTTONS,
         }
     }
 
 
+# The JSON payload only varies in phrase and location values, so serialize the
+# skeleton once and splice those two fields into it per request. Splitting on
+# the placeholders (instead of str-replacing them) keeps user input that
+# happens to contain a placeholder from being substituted twice.
+_PAYLOAD_HEAD, _PAYLOAD_REST = _dumps(
+    build_payload("__PHRASE__", 0, 0, "__LOCATION_VALUES__")
+).split(b'"__PHRASE__"')
+_PAYLOAD_MID, _PAYLOAD_TAIL = _PAYLOAD_REST.split(b'"__LOCATION_VALUES__"')
+
+
+def render_payload(phrase, location_values) -> bytes:
+    """JSON bytes equal to _dumps(build_payload(phrase, ..., location_values))."""
+    return b"".join((
+        _PAYLOAD_HEAD, _dumps(phrase), _PAYLOAD_MID, _dumps(location_values), _PAYLOAD_TAIL,
+    ))
+
+
 def lambda_handler(event, context):
-    print("Received event: " + json.dumps(event))
-    print(event["body"])
-    
-    e = json.loads(event["body"])
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received event: %s", _event_repr.repr(event))
+
+    e = _loads(event["body"])
     # Generate a unique RequestId
     
     # Extract fields from event
@@ -84,56 +200,71 @@ def lambda_handler(event, context):
     location_values =  [e.get("Country"),e.get("State"),e.get("County"),e.get("City"),e.get("zipCode")]
     latitude= 35.052062
     longitude= -78.878573
-    tenant = os.environ.get("SOPHIA_TENANT", "sc-prod-0")
-    origin = os.environ.get("SOPHIA_ORIGIN", "https://www.sc211.org")
-    print(latitude,longitude,phrase,location_values)
-    body_dict = build_payload(
-        phrase=phrase,
-        latitude=latitude,
-        longitude=longitude,
-        location_values=location_values
-    )
-    body_bytes = json.dumps(body_dict).encode("utf-8")
-    print(body_bytes)
-
-    headers = {
-        "Accept": "application/json",
-        "Content-Type": "application/json",
-        "Tenant": tenant,
-        "Origin": origin,
-        # Optional but sometimes helpful:
-        # "Referer": origin + "/",
-        # If the API truly requires cookies (often it doesn't for pure API calls), add:
-        # "Cookie": os.environ.get("SOPHIA_COOKIE", ""),
-    }
+    logger.debug("Search: lat=%s lng=%s phraseLength=%d location=%s",
+                 latitude, longitude, len(phrase or ""), location_values)
+    if WIRE_CBOR:
+        body_bytes = cbor2.dumps(build_payload(
+            phrase=phrase,
+            latitude=latitude,
+            longitude=longitude,
+            location_values=location_values
+        ))
+    else:
+        body_bytes = render_payload(phrase, location_values)
+    logger.debug("Upstream request: %d bytes", len(body_bytes))
 
     try:
-        resp = http.request(
+        resp = _POOL.urlopen(
             "POST",
-            API_URL,
+            _API.request_uri,
             body=body_bytes,
-            headers=headers,
-            timeout=urllib3.Timeout(connect=5.0, read=25.0),
+            headers=_HEADERS,
+            timeout=_TIMEOUT,
             retries=False,
+            preload_content=False,
         )
+        # Read the body exactly once and hand the connection straight back to
+        # the pool; everything below works on this one bytes object.
+        try:
+            data = resp.read(decode_content=True)
+        finally:
+            resp.release_conn()
 
-        # Decode response safely
-        resp_text = resp.data.decode("utf-8", errors="replace")
+        content_type = resp.headers.get("Content-Type", "")
+        if content_type.startswith("application/json") and data:
+            # We only re-emit the upstream document, so once it is known to be
+            # valid JSON splice its bytes into the envelope as-is rather than
+            # re-serializing it. Malformed bodies fall through to the "raw"
+            # envelope below.
+            try:
+                _loads(data)
+            except ValueError:
+                pass
+            else:
+                body = b'{"upstream_status":%d,"response":%s}' % (resp.status, data)
+                return {
+                    "statusCode": resp.status,
+                    "headers": {"Content-Type": "application/json"},
+                    "body": body.decode("utf-8", errors="replace")
+                }
 
-        # Try JSON parse
+        # Try CBOR/JSON parse depending on what the upstream sent back. Both
+        # parsers take bytes, so only decode to text on the fallback path.
         try:
-            resp_json = json.loads(resp_text)
-            print(resp_json)
-        except json.JSONDecodeError:
-            resp_json = {"raw": resp_text}
+            if cbor2 is not None and content_type.startswith("application/cbor"):
+                resp_json = cbor2.loads(data)
+            else:
+                resp_json = _loads(data)
+        except ValueError:  # JSONDecodeError and cbor2 decode errors both subclass ValueError
+            resp_json = {"raw": data.decode("utf-8", errors="replace")}
 
         return {
             "statusCode": resp.status,
             "headers": {"Content-Type": "application/json"},
-            "body": json.dumps({
+            "body": _dumps({
                 "upstream_status": resp.status,
                 "response": resp_json
-            })
+            }).decode("utf-8")
         }
 
     except Exception as e:
@@ -24,8 +24,8 @@ Usage:
 """
 
 import argparse
-import boto3
-from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import json
 import logging
 import sys
@@ -63,6 +63,70 @@ ENVS = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Client factory
+# ---------------------------------------------------------------------------
+
+
+# boto3/botocore are imported on first use rather than at module load, so
+# `--help` and argument errors return without paying for the import.
+boto3 = None
+ClientError = None
+
+
+def _import_boto():
+    global boto3, ClientError
+    if boto3 is None:
+        import boto3 as _boto3
+        from botocore.exceptions import ClientError as _ClientError
+        boto3, ClientError = _boto3, _ClientError
+
+
+@functools.lru_cache(maxsize=None)
+def get_session(region):
+    """One boto3 Session per region, shared by every client."""
+    _import_boto()
+    return boto3.Session(region_name=region)
+
+
+@functools.lru_cache(maxsize=None)
+def get_client(region, service):
+    """Create a boto3 client on first use and reuse it afterwards."""
+    return get_session(region).client(service)
+
+
+# ---------------------------------------------------------------------------
+# Concurrency helpers
+# ---------------------------------------------------------------------------
+
+DELETE_WORKERS = 8
+POLL_INTERVAL = 0.5
+
+
+def for_each(fn, items, parallel=True):
+    """Call fn(item) for every item, on a thread pool when parallel.
+
+    fn is expected to log and swallow its own errors, matching the
+    per-resource try/except blocks used throughout this script.
+    """
+    if not parallel or len(items) < 2:
+        for item in items:
+            fn(item)
+        return
+    with ThreadPoolExecutor(max_workers=min(DELETE_WORKERS, len(items))) as pool:
+        list(pool.map(fn, items))
+
+
+def wait_until_gone(list_fn, timeout):
+    """Poll list_fn() until it returns nothing, for at most timeout seconds."""
+    deadline = time.monotonic() + timeout
+    while list_fn():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(POLL_INTERVAL)
+    return True
+
+
 # ---------------------------------------------------------------------------
 # Discovery helpers
 # ---------------------------------------------------------------------------
@@ -87,15 +151,18 @@ def find_agents_by_prefix(qc, assistant_id, prefix):
     """Find all AI agents whose name starts with prefix."""
     agents = []
     try:
-        resp = qc.list_ai_agents(assistantId=assistant_id)
-        for agent in resp.get('aiAgentSummaries', []):
-            name = agent.get('name', '')
-            if name.startswith(prefix):
-                agents.append({
-                    'id': agent['aiAgentId'],
-                    'name': name,
-                    'type': agent.get('type', ''),
-                })
+        paginator = qc.get_paginator('list_ai_agents')
+        for page in paginator.paginate(
+            assistantId=assistant_id, PaginationConfig={'PageSize': 100}
+        ):
+            for agent in page.get('aiAgentSummaries', []):
+                name = agent.get('name', '')
+                if name.startswith(prefix):
+                    agents.append({
+                        'id': agent['aiAgentId'],
+                        'name': name,
+                        'type': agent.get('type', ''),
+                    })
     except ClientError:
         logger.debug('Could not list agents', exc_info=True)
     return agents
@@ -105,14 +172,17 @@ def find_prompts_by_prefix(qc, assistant_id, prefix):
     """Find all AI prompts whose name starts with prefix."""
     prompts = []
     try:
-        resp = qc.list_ai_prompts(assistantId=assistant_id)
-        for p in resp.get('aiPromptSummaries', []):
-            name = p.get('name', '')
-            if name.startswith(prefix):
-                prompts.append({
-                    'id': p['aiPromptId'],
-                    'name': name,
-                })
+        paginator = qc.get_paginator('list_ai_prompts')
+        for page in paginator.paginate(
+            assistantId=assistant_id, PaginationConfig={'PageSize': 100}
+        ):
+            for p in page.get('aiPromptSummaries', []):
+                name = p.get('name', '')
+                if name.startswith(prefix):
+                    prompts.append({
+                        'id': p['aiPromptId'],
+                        'name': name,
+                    })
     except ClientError:
         logger.debug('Could not list prompts', exc_info=True)
     return prompts
@@ -122,15 +192,16 @@ def find_apps_by_namespace(appi, namespace):
     """Find AppIntegrations apps matching a namespace."""
     apps = []
     try:
-        resp = appi.list_applications()
-        for app in resp.get('Applications', []):
-            if app.get('Namespace', '') == namespace:
-                apps.append({
-                    'arn': app['Arn'],
-                    'id': app['Id'],
-                    'name': app.get('Name', ''),
-                    'namespace': app.get('Namespace', ''),
-                })
+        paginator = appi.get_paginator('list_applications')
+        for page in paginator.paginate():
+            for app in page.get('Applications', []):
+                if app.get('Namespace', '') == namespace:
+                    apps.append({
+                        'arn': app['Arn'],
+                        'id': app['Id'],
+                        'name': app.get('Name', ''),
+                        'namespace': app.get('Namespace', ''),
+                    })
     except ClientError:
         logger.debug('Could not list applications', exc_info=True)
     return apps
@@ -138,6 +209,7 @@ def find_apps_by_namespace(appi, namespace):
 
 def find_connect_associations(connect, instance_id, app_arns):
     """Find Connect integration associations for given app ARNs."""
+    app_arns = set(app_arns)
     associations = []
     try:
         paginator = connect.get_paginator('list_integration_associations')
@@ -172,11 +244,38 @@ def find_gateway_targets(agentcore, gateway_id):
 
 
 def find_security_profiles(connect, instance_id, prefix):
-    """Find security profiles matching a prefix."""
+    """Find security profiles matching a prefix.
+
+    Filters server-side with SearchSecurityProfiles; falls back to listing
+    every profile if search is unavailable (e.g. missing permission).
+    """
+    profiles = []
+    try:
+        paginator = connect.get_paginator('search_security_profiles')
+        for page in paginator.paginate(
+            InstanceId=instance_id,
+            SearchCriteria={'StringCondition': {
+                'FieldName': 'name',
+                'Value': prefix,
+                'ComparisonType': 'STARTS_WITH',
+            }},
+            PaginationConfig={'PageSize': 100},
+        ):
+            for sp in page.get('SecurityProfiles', []):
+                name = sp.get('SecurityProfileName', '')
+                if name.startswith(prefix):
+                    profiles.append({'id': sp['Id'], 'name': name})
+        return profiles
+    except ClientError:
+        logger.debug('Could not search security profiles, listing instead',
+                     exc_info=True)
+
     profiles = []
     try:
         paginator = connect.get_paginator('list_security_profiles')
-        for page in paginator.paginate(InstanceId=instance_id):
+        for page in paginator.paginate(
+            InstanceId=instance_id, PaginationConfig={'PageSize': 100}
+        ):
             for sp in page.get('SecurityProfileSummaryList', []):
                 if sp.get('Name', '').startswith(prefix):
                     profiles.append({
@@ -199,7 +298,8 @@ def remove_orchestrator_assignment(qc, assistant_id, agent_ids, dry_run=True):
         resp = qc.get_assistant(assistantId=assistant_id)
         orch_list = resp.get('assistant', {}).get('orchestratorConfigurationList', [])
         for item in orch_list:
-            assigned_id = item.get('aiAgentId', '').split(':')[0]
+            # aiAgentId is '<uuid>' or '<uuid>:<version>'
+            assigned_id = item.get('aiAgentId', '').partition(':')[0]
             if assigned_id in agent_ids:
                 use_case = item.get('orchestratorUseCase', '')
                 if dry_run:
@@ -225,32 +325,34 @@ def delete_agent_versions(qc, assistant_id, agent_id, dry_run=True):
         resp = qc.list_ai_agent_versions(
             assistantId=assistant_id, aiAgentId=agent_id
         )
-        for v in resp.get('aiAgentVersionSummaries', []):
-            ver = v.get('versionNumber', '')
-            if dry_run:
-                logger.info('  [DRY-RUN] Would delete agent version: %s', ver)
-            else:
-                try:
-                    qc.delete_ai_agent_version(
-                        assistantId=assistant_id,
-                        aiAgentId=agent_id,
-                        versionNumber=ver,
-                    )
-                    logger.info('  Deleted agent version: %s', ver)
-                except Exception as e:
-                    logger.warning('  Could not delete version %s: %s', ver, e)
+        versions = [v.get('versionNumber', '')
+                    for v in resp.get('aiAgentVersionSummaries', [])]
     except Exception as e:
         logger.debug('Could not list agent versions: %s', e)
+        return
+
+    def _delete_version(ver):
+        if dry_run:
+            logger.info('  [DRY-RUN] Would delete agent version: %s', ver)
+            return
+        try:
+            qc.delete_ai_agent_version(
+                assistantId=assistant_id,
+                aiAgentId=agent_id,
+                versionNumber=ver,
+            )
+            logger.info('  Deleted agent version: %s', ver)
+        except Exception as e:
+            logger.warning('  Could not delete version %s: %s', ver, e)
+
+    for_each(_delete_version, versions, parallel=not dry_run)
 
 
 def cleanup_dev(env_name, cfg, dry_run=True):
     """Full cleanup for an environment."""
-    session = boto3.Session(region_name=cfg['region'])
-    cf = session.client('cloudformation')
-    qc = session.client('qconnect')
-    connect = session.client('connect')
-    appi = session.client('appintegrations')
-    agentcore = session.client('bedrock-agentcore-control')
+    region = cfg['region']
+    qc = get_client(region, 'qconnect')
+    connect = get_client(region, 'connect')
 
     stack_name = cfg['stack_name']
     assistant_id = cfg['assistant_id']
@@ -269,29 +371,54 @@ def cleanup_dev(env_name, cfg, dry_run=True):
     logger.info('=' * 60)
 
     # Get stack outputs for gateway ID
-    outputs = get_stack_outputs(cf, stack_name)
+    outputs = get_stack_outputs(get_client(region, 'cloudformation'), stack_name)
     gateway_id = outputs.get('McpGatewayId', '')
     logger.info('MCP Gateway: %s', gateway_id or '(not found)')
 
-    # ---------------------------------------------------------------
-    # Step 1: Find and remove AI agents
-    # ---------------------------------------------------------------
-    logger.info('')
-    logger.info('--- Step 1: AI Agents ---')
-    agents = find_agents_by_prefix(qc, assistant_id, prefix)
-    if not agents:
-        logger.info('  No agents found with prefix: %s', prefix)
+    # Discovery calls are read-only and hit independent services, so run them
+    # concurrently. Clients are created here (boto3 Sessions are not
+    # thread-safe; clients are).
+    appi = get_client(region, 'appintegrations') if gateway_id else None
+    agentcore = get_client(region, 'bedrock-agentcore-control') if gateway_id else None
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        fut_agents = pool.submit(find_agents_by_prefix, qc, assistant_id, prefix)
+        fut_prompts = pool.submit(find_prompts_by_prefix, qc, assistant_id, prefix)
+        fut_profiles = pool.submit(find_security_profiles, connect, instance_id, prefix)
+        if gateway_id:
+            fut_apps = pool.submit(find_apps_by_namespace, appi, gateway_id)
+            fut_targets = pool.submit(find_gateway_targets, agentcore, gateway_id)
+
+    agents = fut_agents.result()
+    prompts = fut_prompts.result()
+    profiles = fut_profiles.result()
+    apps = fut_apps.result() if gateway_id else []
+    targets = fut_targets.result() if gateway_id else []
+
+    # Associations are only looked up for our apps, so no apps means none of
+    # ours exist either — skip every step on an already-clean environment but
+    # still fall through to the summary.
+    if not (agents or prompts or profiles or apps or targets):
+        logger.info('')
+        logger.info('Nothing to clean up for prefix: %s', prefix)
     else:
-        agent_ids = [a['id'] for a in agents]
-        # First remove orchestrator assignment
-        remove_orchestrator_assignment(qc, assistant_id, agent_ids, dry_run)
+        # ---------------------------------------------------------------
+        # Step 1: Find and remove AI agents
+        # ---------------------------------------------------------------
+        logger.info('')
+        logger.info('--- Step 1: AI Agents ---')
+        if not agents:
+            logger.info('  No agents found with prefix: %s', prefix)
+        else:
+            agent_ids = {a['id'] for a in agents}
+            # First remove orchestrator assignment
+            remove_orchestrator_assignment(qc, assistant_id, agent_ids, dry_run)
 
-        for agent in agents:
-            logger.info('  Agent: %s (ID: %s, type: %s)',
-                        agent['name'], agent['id'], agent['type'])
-            if dry_run:
-                logger.info('  [DRY-RUN] Would delete agent and versions')
-            else:
+            def _delete_agent(agent):
+                logger.info('  Agent: %s (ID: %s, type: %s)',
+                            agent['name'], agent['id'], agent['type'])
+                if dry_run:
+                    logger.info('  [DRY-RUN] Would delete agent and versions')
+                    return
                 delete_agent_versions(qc, assistant_id, agent['id'], dry_run=False)
                 try:
                     qc.delete_ai_agent(
@@ -301,20 +428,21 @@ def cleanup_dev(env_name, cfg, dry_run=True):
                 except Exception as e:
                     logger.warning('  Could not delete agent: %s', e)
 
-    # ---------------------------------------------------------------
-    # Step 2: Find and remove AI prompts
-    # ---------------------------------------------------------------
-    logger.info('')
-    logger.info('--- Step 2: AI Prompts ---')
-    prompts = find_prompts_by_prefix(qc, assistant_id, prefix)
-    if not prompts:
-        logger.info('  No prompts found with prefix: %s', prefix)
-    else:
-        for prompt in prompts:
-            logger.info('  Prompt: %s (ID: %s)', prompt['name'], prompt['id'])
-            if dry_run:
-                logger.info('  [DRY-RUN] Would delete prompt')
-            else:
+            for_each(_delete_agent, agents, parallel=not dry_run)
+
+        # ---------------------------------------------------------------
+        # Step 2: Find and remove AI prompts
+        # ---------------------------------------------------------------
+        logger.info('')
+        logger.info('--- Step 2: AI Prompts ---')
+        if not prompts:
+            logger.info('  No prompts found with prefix: %s', prefix)
+        else:
+            def _delete_prompt(prompt):
+                logger.info('  Prompt: %s (ID: %s)', prompt['name'], prompt['id'])
+                if dry_run:
+                    logger.info('  [DRY-RUN] Would delete prompt')
+                    return
                 try:
                     qc.delete_ai_prompt(
                         assistantId=assistant_id, aiPromptId=prompt['id']
@@ -323,22 +451,24 @@ def cleanup_dev(env_name, cfg, dry_run=True):
                 except Exception as e:
                     logger.warning('  Could not delete prompt: %s', e)
 
-    # ---------------------------------------------------------------
-    # Step 3: Find and remove Connect integration associations
-    # ---------------------------------------------------------------
-    logger.info('')
-    logger.info('--- Step 3: Connect Integration Associations ---')
-    if gateway_id:
-        apps = find_apps_by_namespace(appi, gateway_id)
-        app_arns = [a['arn'] for a in apps]
-        associations = find_connect_associations(connect, instance_id, app_arns)
-        if not associations:
-            logger.info('  No associations found')
-        for assoc in associations:
-            logger.info('  Association: %s', assoc['id'])
-            if dry_run:
-                logger.info('  [DRY-RUN] Would delete association')
-            else:
+            for_each(_delete_prompt, prompts, parallel=not dry_run)
+
+        # ---------------------------------------------------------------
+        # Step 3: Find and remove Connect integration associations
+        # ---------------------------------------------------------------
+        logger.info('')
+        logger.info('--- Step 3: Connect Integration Associations ---')
+        if gateway_id:
+            app_arns = {a['arn'] for a in apps}
+            associations = find_connect_associations(connect, instance_id, app_arns)
+            if not associations:
+                logger.info('  No associations found')
+
+            def _delete_association(assoc):
+                logger.info('  Association: %s', assoc['id'])
+                if dry_run:
+                    logger.info('  [DRY-RUN] Would delete association')
+                    return
                 try:
                     connect.delete_integration_association(
                         InstanceId=instance_id,
@@ -347,48 +477,59 @@ def cleanup_dev(env_name, cfg, dry_run=True):
                     logger.info('  Deleted association: %s', assoc['id'])
                 except Exception as e:
                     logger.warning('  Could not delete association: %s', e)
-        time.sleep(2) if not dry_run and associations else None
-    else:
-        logger.info('  No gateway ID — skipping')
 
-    # ---------------------------------------------------------------
-    # Step 4: Find and remove AppIntegrations applications
-    # ---------------------------------------------------------------
-    logger.info('')
-    logger.info('--- Step 4: AppIntegrations Applications ---')
-    if gateway_id:
-        apps = find_apps_by_namespace(appi, gateway_id)
-        if not apps:
-            logger.info('  No apps found with namespace: %s', gateway_id)
-        for app in apps:
-            logger.info('  App: %s (ID: %s)', app['name'], app['id'])
-            if dry_run:
-                logger.info('  [DRY-RUN] Would delete app')
-            else:
+            for_each(_delete_association, associations, parallel=not dry_run)
+            if not dry_run and associations:
+                wait_until_gone(
+                    lambda: find_connect_associations(connect, instance_id, app_arns),
+                    timeout=2,
+                )
+        else:
+            logger.info('  No gateway ID — skipping')
+
+        # ---------------------------------------------------------------
+        # Step 4: Find and remove AppIntegrations applications
+        # ---------------------------------------------------------------
+        logger.info('')
+        logger.info('--- Step 4: AppIntegrations Applications ---')
+        if gateway_id:
+            if not apps:
+                logger.info('  No apps found with namespace: %s', gateway_id)
+
+            def _delete_app(app):
+                logger.info('  App: %s (ID: %s)', app['name'], app['id'])
+                if dry_run:
+                    logger.info('  [DRY-RUN] Would delete app')
+                    return
                 try:
                     appi.delete_application(Arn=app['arn'])
                     logger.info('  Deleted app: %s', app['name'])
                 except Exception as e:
                     logger.warning('  Could not delete app: %s', e)
-        time.sleep(2) if not dry_run and apps else None
-    else:
-        logger.info('  No gateway ID — skipping')
 
-    # ---------------------------------------------------------------
-    # Step 5: Find and remove MCP gateway targets
-    # ---------------------------------------------------------------
-    logger.info('')
-    logger.info('--- Step 5: MCP Gateway Targets ---')
-    if gateway_id:
-        targets = find_gateway_targets(agentcore, gateway_id)
-        if not targets:
-            logger.info('  No targets found on gateway: %s', gateway_id)
-        for target in targets:
-            logger.info('  Target: %s (ID: %s, status: %s)',
-                        target['name'], target['id'], target['status'])
-            if dry_run:
-                logger.info('  [DRY-RUN] Would delete target')
-            else:
+            for_each(_delete_app, apps, parallel=not dry_run)
+            if not dry_run and apps:
+                wait_until_gone(
+                    lambda: find_apps_by_namespace(appi, gateway_id), timeout=2,
+                )
+        else:
+            logger.info('  No gateway ID — skipping')
+
+        # ---------------------------------------------------------------
+        # Step 5: Find and remove MCP gateway targets
+        # ---------------------------------------------------------------
+        logger.info('')
+        logger.info('--- Step 5: MCP Gateway Targets ---')
+        if gateway_id:
+            if not targets:
+                logger.info('  No targets found on gateway: %s', gateway_id)
+
+            def _delete_target(target):
+                logger.info('  Target: %s (ID: %s, status: %s)',
+                            target['name'], target['id'], target['status'])
+                if dry_run:
+                    logger.info('  [DRY-RUN] Would delete target')
+                    return
                 try:
                     agentcore.delete_gateway_target(
                         gatewayIdentifier=gateway_id,
@@ -397,26 +538,30 @@ def cleanup_dev(env_name, cfg, dry_run=True):
                     logger.info('  Deleted target: %s', target['name'])
                 except Exception as e:
                     logger.warning('  Could not delete target: %s', e)
-        # Wait for target deletion
-        if not dry_run and targets:
-            logger.info('  Waiting for target deletion to propagate...')
-            time.sleep(5)
-    else:
-        logger.info('  No gateway ID — skipping')
 
-    # ---------------------------------------------------------------
-    # Step 6: Security profile MCP permissions
-    # ---------------------------------------------------------------
-    logger.info('')
-    logger.info('--- Step 6: Security Profile ---')
-    profiles = find_security_profiles(connect, instance_id, prefix)
-    if not profiles:
-        logger.info('  No security profiles found with prefix: %s', prefix)
-    for sp in profiles:
-        logger.info('  Profile: %s (ID: %s)', sp['name'], sp['id'])
-        if dry_run:
-            logger.info('  [DRY-RUN] Would clear MCP permissions')
+            for_each(_delete_target, targets, parallel=not dry_run)
+            # Wait for target deletion
+            if not dry_run and targets:
+                logger.info('  Waiting for target deletion to propagate...')
+                wait_until_gone(
+                    lambda: find_gateway_targets(agentcore, gateway_id), timeout=5,
+                )
         else:
+            logger.info('  No gateway ID — skipping')
+
+        # ---------------------------------------------------------------
+        # Step 6: Security profile MCP permissions
+        # ---------------------------------------------------------------
+        logger.info('')
+        logger.info('--- Step 6: Security Profile ---')
+        if not profiles:
+            logger.info('  No security profiles found with prefix: %s', prefix)
+
+        def _clear_profile(sp):
+            logger.info('  Profile: %s (ID: %s)', sp['name'], sp['id'])
+            if dry_run:
+                logger.info('  [DRY-RUN] Would clear MCP permissions')
+                return
             try:
                 connect.update_security_profile(
                     SecurityProfileId=sp['id'],
@@ -427,6 +572,8 @@ def cleanup_dev(env_name, cfg, dry_run=True):
             except Exception as e:
                 logger.warning('  Could not clear permissions: %s', e)
 
+        for_each(_clear_profile, profiles, parallel=not dry_run)
+
     # ---------------------------------------------------------------
     # Summary
     # ---------------------------------------------------------------
@@ -25,15 +25,26 @@ Usage:
 
 import argparse
 import boto3
-from botocore.exceptions import ClientError
-import io
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import functools
+import hashlib
 import json
 import logging
 import os
 import sys
+import tempfile
 import time
 import zipfile
 
+try:
+    import orjson
+except ImportError:  # optional: pip install orjson for faster JSON
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
@@ -60,12 +71,19 @@ DEFAULT_STACK_NAME = 'stability360-actions'
 DEFAULT_REGION = 'us-west-2'
 DEFAULT_ENVIRONMENT = 'dev'
 
-POLL_INTERVAL = 10
+# Stack polling: 2s while the status is changing, backing off 1.5x to 30s
+# when it stays the same. The overall wait is capped by --stack-timeout.
+STACK_POLL_MIN_DELAY = 2.0
+STACK_POLL_MAX_DELAY = 30.0
+STACK_POLL_TIMEOUT = 3600
 
 OPENAPI_S3_KEY = 'openapi/actions-spec.yaml'
 
 # MCP tool operation IDs (from OpenAPI spec)
-MCP_TOOL_OPERATIONS = ['resourceLookup', 'intakeHelper']
+MCP_TOOL_OPERATIONS = ('resourceLookup', 'intakeHelper')
+
+# Agent-facing tool names use underscores where the MCP names have hyphens
+_HYPHEN_TABLE = str.maketrans('-', '_')
 
 ORCHESTRATION_PROMPT_MODEL = 'us.anthropic.claude-sonnet-4-5-20250929-v1:0'
 
@@ -96,42 +114,109 @@ INTAKE_HELPER_TOOL_INSTRUCTION = (
 
 
 # ---------------------------------------------------------------------------
-# Resource names — derived from stack name
+# boto3 clients
 # ---------------------------------------------------------------------------
 
-API_KEY_CREDENTIAL_NAME = None
-MCP_TARGET_NAME = None
-AI_AGENT_NAME = None
-AI_AGENT_DESCRIPTION = None
-MCP_TOOL_NAMES = None          # list of tool names
-MCP_TOOL_NAMES_SAFE = None     # list of tool names (hyphens replaced)
-ORCHESTRATION_PROMPT_NAME = None
-SECURITY_PROFILE_NAME = None
-
-
-def init_resource_names(stack_name):
-    """Derive all resource names from the stack name."""
-    global API_KEY_CREDENTIAL_NAME, MCP_TARGET_NAME
-    global AI_AGENT_NAME, AI_AGENT_DESCRIPTION
-    global MCP_TOOL_NAMES, MCP_TOOL_NAMES_SAFE
-    global ORCHESTRATION_PROMPT_NAME
-    global SECURITY_PROFILE_NAME
-
-    API_KEY_CREDENTIAL_NAME = f'{stack_name}-api-key'
-    MCP_TARGET_NAME = f'{stack_name}-api'
-
-    AI_AGENT_NAME = f'{stack_name}-orchestration'
-    AI_AGENT_DESCRIPTION = (
-        f'AI agent for {stack_name} — Intake Helper, Resource Lookup, Scoring '
-        f'({len(MCP_TOOL_OPERATIONS)} MCP tools)'
+
+# Clients are shared across worker threads, so give each a pool large
+# enough that concurrent calls never queue for a connection. Adaptive
+# retries back off client-side when the control-plane APIs throttle.
+BOTO_CONFIG = Config(
+    retries={'mode': 'adaptive', 'max_attempts': 8},
+    max_pool_connections=16,
+    tcp_keepalive=True,
+)
+
+# Shared pool for independent AWS lookups issued ahead of their point of use
+LOOKUP_POOL = ThreadPoolExecutor(max_workers=8)
+
+# Stream files to S3 from disk; multipart only kicks in for large specs
+SPEC_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    max_concurrency=8,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def get_client(session, service):
+    """Return a client for service, created once per session and reused."""
+    return session.client(service, config=BOTO_CONFIG)
+
+
+@functools.lru_cache(maxsize=None)
+def get_account_id(session):
+    """AWS account ID for the session, looked up once."""
+    return get_client(session, 'sts').get_caller_identity()['Account']
+
+
+# Error codes meaning a create raced with an existing resource of the same name
+ALREADY_EXISTS_ERROR_CODES = frozenset({'ConflictException', 'ResourceAlreadyExistsException'})
+
+
+def is_already_exists(error):
+    """True if error is a ClientError saying the resource already exists."""
+    return (
+        isinstance(error, ClientError)
+        and error.response.get('Error', {}).get('Code') in ALREADY_EXISTS_ERROR_CODES
     )
 
-    # Tool name format: {target-name}___{operationId}
-    MCP_TOOL_NAMES = [f'{MCP_TARGET_NAME}___{op}' for op in MCP_TOOL_OPERATIONS]
-    MCP_TOOL_NAMES_SAFE = [n.replace('-', '_') for n in MCP_TOOL_NAMES]
 
-    ORCHESTRATION_PROMPT_NAME = f'{stack_name}-orchestration'
-    SECURITY_PROFILE_NAME = f'{stack_name}-AI-Agent'
+# ---------------------------------------------------------------------------
+# Resource names — derived from stack name
+# ---------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=None)
+def mcp_tool_names(target_name):
+    """(operation ID, tool name, agent-safe tool name) for each MCP operation.
+
+    Tool name format: {target-name}___{operationId}
+    """
+    tools = []
+    for op in MCP_TOOL_OPERATIONS:
+        tool_name = f'{target_name}___{op}'
+        tools.append((op, tool_name, tool_name.translate(_HYPHEN_TABLE)))
+    return tuple(tools)
+
+
+@dataclass(frozen=True, slots=True)
+class ResourceNames:
+    """All resource names for one stack. Built once and passed explicitly."""
+
+    api_key_credential: str
+    mcp_target: str
+    mcp_app: str
+    ai_agent: str
+    ai_agent_description: str
+    mcp_tool_names: tuple
+    mcp_tool_names_safe: tuple
+    orchestration_prompt: str
+    security_profile: str
+
+    @classmethod
+    def from_stack(cls, stack_name):
+        """Derive all resource names from the stack name."""
+        mcp_target = f'{stack_name}-api'
+        tools = mcp_tool_names(mcp_target)
+        return cls(
+            api_key_credential=f'{stack_name}-api-key',
+            mcp_target=mcp_target,
+            mcp_app=f'{stack_name} MCP Server',
+            ai_agent=f'{stack_name}-orchestration',
+            ai_agent_description=(
+                f'AI agent for {stack_name} — Intake Helper, Resource Lookup, Scoring '
+                f'({len(MCP_TOOL_OPERATIONS)} MCP tools)'
+            ),
+            mcp_tool_names=tuple(name for _, name, _ in tools),
+            mcp_tool_names_safe=tuple(safe for _, _, safe in tools),
+            orchestration_prompt=f'{stack_name}-orchestration',
+            security_profile=f'{stack_name}-AI-Agent',
+        )
+
+
+@functools.lru_cache(maxsize=16)
+def names_for(stack_name):
+    """ResourceNames for stack_name, derived once per stack and reused."""
+    return ResourceNames.from_stack(stack_name)
 
 
 # ---------------------------------------------------------------------------
@@ -139,13 +224,31 @@ def init_resource_names(stack_name):
 # ---------------------------------------------------------------------------
 
 
-def stack_exists(cf_client, stack_name):
+def _describe_once(cf_client, stack_name):
+    """Return (exists, status, parameters) from a single describe_stacks call."""
     try:
         resp = cf_client.describe_stacks(StackName=stack_name)
-        status = resp['Stacks'][0]['StackStatus']
-        return status != 'DELETE_COMPLETE'
     except cf_client.exceptions.ClientError:
+        return False, None, {}
+    stack = resp['Stacks'][0]
+    status = stack['StackStatus']
+    params = {p['ParameterKey']: p.get('ParameterValue') for p in stack.get('Parameters', [])}
+    return status != 'DELETE_COMPLETE', status, params
+
+
+def stack_exists(cf_client, stack_name):
+    exists, _, _ = _describe_once(cf_client, stack_name)
+    return exists
+
+
+def _deployed_template_matches(cf_client, stack_name, template_body):
+    """True if the stack's current (original) template equals template_body."""
+    try:
+        resp = cf_client.get_template(StackName=stack_name, TemplateStage='Original')
+    except ClientError:
+        logger.debug('Could not read deployed template', exc_info=True)
         return False
+    return resp.get('TemplateBody') == template_body
 
 
 def get_stack_status(cf_client, stack_name):
@@ -156,7 +259,7 @@ def get_stack_status(cf_client, stack_name):
 def deploy_stack(cf_client, stack_name, template_body, environment,
                  enable_mcp=False, enable_connect=False,
                  connect_instance_id='', connect_instance_url='',
-                 openapi_spec_url=''):
+                 openapi_spec_url='', stack_timeout=STACK_POLL_TIMEOUT):
     params = [
         {'ParameterKey': 'Environment', 'ParameterValue': environment},
         {'ParameterKey': 'EnableMcpGateway', 'ParameterValue': 'true' if enable_mcp else 'false'},
@@ -172,13 +275,23 @@ def deploy_stack(cf_client, stack_name, template_body, environment,
         'Capabilities': ['CAPABILITY_NAMED_IAM'],
     }
 
-    if stack_exists(cf_client, stack_name):
-        status = get_stack_status(cf_client, stack_name)
+    exists, status, deployed_params = _describe_once(cf_client, stack_name)
+    if exists:
+        # A stack last deployed from this exact template and parameters has
+        # nothing to change — skip the no-op update and its wait entirely.
+        wanted_params = {p['ParameterKey']: p['ParameterValue'] for p in params}
+        if (status in ('CREATE_COMPLETE', 'UPDATE_COMPLETE')
+                and deployed_params == wanted_params
+                and _deployed_template_matches(cf_client, stack_name, template_body)):
+            logger.info('Template and parameters unchanged — stack is up to date.')
+            return 'NOOP'
+
         if status == 'ROLLBACK_COMPLETE':
             logger.warning('Stack is in ROLLBACK_COMPLETE — deleting before recreating...')
-            cf_client.delete_stack(StackName=stack_name)
-            wait_for_stack(cf_client, stack_name, target='DELETE_COMPLETE')
-            logger.info('Deleted. Creating stack...')
+            status = delete_stack(cf_client, stack_name, timeout=stack_timeout)
+            if status != 'DELETE_COMPLETE':
+                raise RuntimeError(f'Could not delete {stack_name} before recreating it: {status}')
+            logger.info('Creating stack...')
             cf_client.create_stack(**kwargs)
             return 'CREATE'
 
@@ -197,22 +310,58 @@ def deploy_stack(cf_client, stack_name, template_body, environment,
         return 'CREATE'
 
 
-def wait_for_stack(cf_client, stack_name, target=None):
+def _log_stack_failures(cf_client, stack_name):
+    """Log the most recent failed resource events for a stack."""
+    try:
+        events = cf_client.describe_stack_events(StackName=stack_name)['StackEvents']
+    except ClientError:
+        logger.debug('Could not read stack events', exc_info=True)
+        return
+    for event in events[:20]:
+        if event.get('ResourceStatus', '').endswith('_FAILED'):
+            logger.warning('  %s (%s): %s', event.get('LogicalResourceId'),
+                           event.get('ResourceStatus'),
+                           event.get('ResourceStatusReason', ''))
+
+
+def wait_for_stack(cf_client, stack_name, target, timeout=STACK_POLL_TIMEOUT):
+    """Block until the stack leaves its *_IN_PROGRESS state; return the status.
+
+    Polls quickly while the stack status keeps changing and backs off while
+    it stays the same, so short stacks return promptly without hammering
+    DescribeStacks on long ones. Any terminal status (complete, failed or
+    rolled back) ends the wait; callers compare it against target. Raises
+    TimeoutError if the stack is still in progress after timeout seconds.
+    """
     logger.info('Waiting for stack operation to complete...')
+    deadline = time.monotonic() + timeout
+    delay = STACK_POLL_MIN_DELAY
+    last_status = None
     while True:
         try:
             status = get_stack_status(cf_client, stack_name)
-        except cf_client.exceptions.ClientError:
+        except ClientError:
             if target == 'DELETE_COMPLETE':
                 logger.info('Stack deleted.')
                 return 'DELETE_COMPLETE'
             raise
-        logger.info('  Status: %s', status)
-        if status == target:
-            return status
-        if status.endswith('_COMPLETE') or status.endswith('_FAILED'):
+        if not status.endswith('_IN_PROGRESS'):
+            logger.info('  Status: %s', status)
+            if status != target and ('FAILED' in status or 'ROLLBACK' in status):
+                _log_stack_failures(cf_client, stack_name)
             return status
-        time.sleep(POLL_INTERVAL)
+        if time.monotonic() >= deadline:
+            raise TimeoutError(
+                f'Stack {stack_name} still {status} after {timeout}s '
+                '(raise --stack-timeout to wait longer)'
+            )
+        if status != last_status:
+            logger.info('  Status: %s', status)
+            last_status = status
+            delay = STACK_POLL_MIN_DELAY
+        else:
+            delay = min(delay * 1.5, STACK_POLL_MAX_DELAY)
+        time.sleep(delay)
 
 
 def get_stack_outputs(cf_client, stack_name):
@@ -221,32 +370,71 @@ def get_stack_outputs(cf_client, stack_name):
     return {o['OutputKey']: o['OutputValue'] for o in outputs}
 
 
-def delete_stack(cf_client, stack_name):
+def delete_stack(cf_client, stack_name, timeout=STACK_POLL_TIMEOUT):
+    """Delete the stack and wait for it; return the final status."""
     logger.info('Deleting stack: %s', stack_name)
     cf_client.delete_stack(StackName=stack_name)
-    wait_for_stack(cf_client, stack_name, target='DELETE_COMPLETE')
-    logger.info('Stack deleted.')
+    status = wait_for_stack(cf_client, stack_name, target='DELETE_COMPLETE', timeout=timeout)
+    if status == 'DELETE_COMPLETE':
+        logger.info('Stack deleted.')
+    else:
+        logger.error('Stack deletion ended with status: %s', status)
+    return status
+
+
+def wait_until(predicate, initial_delay=1.0, max_delay=8.0, max_attempts=60):
+    """Poll predicate() until it returns True; return False if attempts run out.
+
+    Starts with a short delay (fast operations finish quickly) and backs off
+    by 1.5x up to max_delay to keep API calls down on slow ones.
+    """
+    delay = initial_delay
+    for _ in range(max_attempts):
+        if predicate():
+            return True
+        time.sleep(delay)
+        delay = min(delay * 1.5, max_delay)
+    return False
+
+
+def run_in_parallel(tasks, max_workers=4):
+    """Run independent zero-arg callables concurrently.
+
+    Each task is expected to log its own warnings; anything that still
+    escapes is logged here so one failure never stops the others.
+    """
+    tasks = [t for t in tasks if t]
+    if not tasks:
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as pool:
+        futures = [pool.submit(t) for t in tasks]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning('Teardown step failed: %s', e)
 
 
 def teardown_all(session, stack_name, connect_instance_id, region,
-                  delete_security_profile=False):
+                  delete_security_profile=False, stack_timeout=STACK_POLL_TIMEOUT):
     """Full teardown: delete all resources created by deploy.py.
 
-    Order matters — resources have dependencies:
-      1. Delete AI Agent + AI Prompt (Q Connect)
-      2. Clear security profile MCP apps
-      3. Delete Connect ↔ MCP integration association
-      4. Delete App Integrations application
-      5. Delete MCP gateway target
-      6. Delete MCP gateway
-      7. Delete API key credential
-      8. Delete CloudFormation stack
+    Order matters — resources have dependencies. Steps with no dependency
+    on each other run concurrently, one level at a time:
+      Level 1: AI Agent (Q Connect), security profile MCP apps,
+               task template / task flow / case template
+      Level 2: AI Prompt (used by the agent), Connect ↔ MCP integration
+               association, MCP gateway target
+      Level 3: App Integrations application, MCP gateway, API key credential
+      Level 4: CloudFormation stack
 
     Security profile deletion is skipped by default (AWS sticky reference).
     Pass delete_security_profile=True to attempt it (use --delete-security-profile).
-    The function logs warnings and continues on individual failures.
+    The function logs warnings and continues on individual failures; it
+    returns False only if the CloudFormation stack could not be deleted.
     """
-    cf_client = session.client('cloudformation')
+    cf_client = get_client(session, 'cloudformation')
+    names = names_for(stack_name)
 
     # --- Read stack outputs (needed for gateway ID, etc.) ---
     outputs = {}
@@ -257,128 +445,83 @@ def teardown_all(session, stack_name, connect_instance_id, region,
 
     gateway_id = outputs.get('McpGatewayId', '')
 
-    # --- 1. Delete AI Agent + Prompt ---
+    assistant_id = None
+    app_arn = None
     if connect_instance_id:
+        connect_client = get_client(session, 'connect')
+        appintegrations_client = get_client(session, 'appintegrations')
+        qconnect_client = get_client(session, 'qconnect')
+
         try:
             assistant_id, _ = find_qconnect_assistant(session, connect_instance_id)
-            if assistant_id:
-                qconnect_client = session.client('qconnect')
-
-                # Delete AI Agent
-                agent_id, _ = find_existing_ai_agent(qconnect_client, assistant_id, AI_AGENT_NAME)
-                if agent_id:
-                    logger.info('Deleting AI Agent: %s (%s)', AI_AGENT_NAME, agent_id)
-                    try:
-                        qconnect_client.delete_ai_agent(
-                            assistantId=assistant_id, aiAgentId=agent_id,
-                        )
-                        logger.info('AI Agent deleted.')
-                    except Exception as e:
-                        logger.warning('Could not delete AI Agent: %s', e)
-                else:
-                    logger.info('AI Agent not found — nothing to delete.')
-
-                # Delete AI Prompt
-                prompt_id, _ = find_existing_prompt(qconnect_client, assistant_id, ORCHESTRATION_PROMPT_NAME)
-                if prompt_id:
-                    logger.info('Deleting AI Prompt: %s (%s)', ORCHESTRATION_PROMPT_NAME, prompt_id)
-                    try:
-                        qconnect_client.delete_ai_prompt(
-                            assistantId=assistant_id, aiPromptId=prompt_id,
-                        )
-                        logger.info('AI Prompt deleted.')
-                    except Exception as e:
-                        logger.warning('Could not delete AI Prompt: %s', e)
-                else:
-                    logger.info('AI Prompt not found — nothing to delete.')
         except Exception as e:
             logger.warning('Could not clean up Q Connect resources: %s', e)
 
-    # --- 2-4. Clean up Connect integration + security profile ---
-    if connect_instance_id:
-        connect_client = session.client('connect')
-        appintegrations_client = session.client('appintegrations')
-
         # Find the MCP app
-        app_name = f'{stack_name} MCP Server'
         app_namespace = gateway_id
-        app_arn, app_id = None, None
         try:
-            app_arn, app_id = find_existing_mcp_app(
-                appintegrations_client, app_namespace, app_name,
+            app_arn, _ = find_existing_mcp_app(
+                appintegrations_client, app_namespace, names.mcp_app,
             )
         except Exception:
             logger.debug('Could not search for MCP app', exc_info=True)
+    if gateway_id:
+        agentcore_client = get_client(session, 'bedrock-agentcore-control')
+
+    # --- Level 1 ---
 
-        # 2. Clear security profile MCP apps
+    def delete_agent():
+        agent_id, _ = find_existing_ai_agent(qconnect_client, assistant_id, names.ai_agent)
+        if not agent_id:
+            logger.info('AI Agent not found — nothing to delete.')
+            return
+        logger.info('Deleting AI Agent: %s (%s)', names.ai_agent, agent_id)
+        try:
+            qconnect_client.delete_ai_agent(
+                assistantId=assistant_id, aiAgentId=agent_id,
+            )
+            _clear_ai_name_index()
+            logger.info('AI Agent deleted.')
+        except Exception as e:
+            logger.warning('Could not delete AI Agent: %s', e)
+
+    def clear_security_profile():
         sp_id = None
         try:
-            paginator = connect_client.get_paginator('list_security_profiles')
-            for page in paginator.paginate(InstanceId=connect_instance_id):
-                for sp in page.get('SecurityProfileSummaryList', []):
-                    if sp.get('Name') == SECURITY_PROFILE_NAME:
-                        sp_id = sp['Id']
-                        break
-                if sp_id:
-                    break
+            sp_id = find_security_profile_id(
+                connect_client, connect_instance_id, names.security_profile,
+            )
         except Exception:
             pass
+        if not sp_id:
+            return
 
-        if sp_id:
-            logger.info('Clearing MCP apps from security profile: %s', sp_id)
+        logger.info('Clearing MCP apps from security profile: %s', sp_id)
+        try:
+            connect_client.update_security_profile(
+                SecurityProfileId=sp_id,
+                InstanceId=connect_instance_id,
+                Applications=[],
+            )
+            logger.info('Security profile MCP apps cleared.')
+        except Exception as e:
+            logger.warning('Could not clear security profile apps: %s', e)
+
+        if delete_security_profile:
             try:
-                connect_client.update_security_profile(
+                connect_client.delete_security_profile(
                     SecurityProfileId=sp_id,
                     InstanceId=connect_instance_id,
-                    Applications=[],
                 )
-                logger.info('Security profile MCP apps cleared.')
+                find_security_profile_id.cache_clear()
+                logger.info('Security profile deleted.')
             except Exception as e:
-                logger.warning('Could not clear security profile apps: %s', e)
-
-            if delete_security_profile:
-                try:
-                    connect_client.delete_security_profile(
-                        SecurityProfileId=sp_id,
-                        InstanceId=connect_instance_id,
-                    )
-                    logger.info('Security profile deleted.')
-                except Exception as e:
-                    logger.warning('Could not delete security profile: %s', e)
-            else:
-                logger.info('Security profile kept (reused on next deploy). '
-                            'Use --delete-security-profile to attempt deletion.')
-
-        # 3. Delete integration association
-        if app_arn:
-            assoc_id = find_existing_connect_association(
-                connect_client, connect_instance_id, app_arn,
-            )
-            if assoc_id:
-                logger.info('Deleting Connect integration association: %s', assoc_id)
-                try:
-                    connect_client.delete_integration_association(
-                        InstanceId=connect_instance_id,
-                        IntegrationAssociationId=assoc_id,
-                    )
-                    logger.info('Integration association deleted.')
-                except Exception as e:
-                    logger.warning('Could not delete integration association: %s', e)
-
-        # 4. Delete app integration
-        if app_arn:
-            logger.info('Deleting MCP app integration: %s', app_arn)
-            try:
-                appintegrations_client.delete_application(Arn=app_arn)
-                logger.info('App integration deleted.')
-            except Exception as e:
-                logger.warning('Could not delete app integration: %s', e)
-
-    # --- 4b. Delete task resources (template, flow, case template) ---
-    if connect_instance_id:
-        connect_client = session.client('connect')
+                logger.warning('Could not delete security profile: %s', e)
+        else:
+            logger.info('Security profile kept (reused on next deploy). '
+                        'Use --delete-security-profile to attempt deletion.')
 
-        # Delete task template
+    def delete_task_template():
         try:
             resp = connect_client.list_task_templates(InstanceId=connect_instance_id, Status='ACTIVE')
             for tmpl in resp.get('TaskTemplates', []):
@@ -392,7 +535,8 @@ def teardown_all(session, stack_name, connect_instance_id, region,
         except Exception as e:
             logger.warning('Could not delete task template: %s', e)
 
-        # Delete task contact flow (set to ARCHIVED — Connect flows can't be truly deleted)
+    def archive_task_flow():
+        # Connect flows can't be truly deleted — set to ARCHIVED
         try:
             paginator = connect_client.get_paginator('list_contact_flows')
             for page in paginator.paginate(InstanceId=connect_instance_id):
@@ -408,64 +552,147 @@ def teardown_all(session, stack_name, connect_instance_id, region,
         except Exception as e:
             logger.warning('Could not archive task flow: %s', e)
 
-        # Delete case template
+    def deactivate_case_template():
         cases_domain_id = get_cases_domain_id(session, connect_instance_id)
-        if cases_domain_id:
-            try:
-                cases_client = session.client('connectcases')
-                resp = cases_client.list_templates(domainId=cases_domain_id, maxResults=50)
-                for t in resp.get('templates', []):
-                    if t['name'] == CASE_TEMPLATE_NAME:
-                        logger.info('Deactivating case template: %s (%s)', CASE_TEMPLATE_NAME, t['templateId'])
-                        cases_client.update_template(
-                            domainId=cases_domain_id, templateId=t['templateId'],
-                            status='Inactive',
-                        )
-                        logger.info('Case template deactivated.')
-                        break
-            except Exception as e:
-                logger.warning('Could not deactivate case template: %s', e)
+        if not cases_domain_id:
+            return
+        try:
+            cases_client = get_client(session, 'connectcases')
+            resp = cases_client.list_templates(domainId=cases_domain_id, maxResults=50)
+            for t in resp.get('templates', []):
+                if t['name'] == CASE_TEMPLATE_NAME:
+                    logger.info('Deactivating case template: %s (%s)', CASE_TEMPLATE_NAME, t['templateId'])
+                    cases_client.update_template(
+                        domainId=cases_domain_id, templateId=t['templateId'],
+                        status='Inactive',
+                    )
+                    logger.info('Case template deactivated.')
+                    break
+        except Exception as e:
+            logger.warning('Could not deactivate case template: %s', e)
 
-    # --- 5-6. Delete MCP gateway target + gateway ---
-    if gateway_id:
-        agentcore_client = session.client('bedrock-agentcore-control')
+    # --- Level 2 ---
 
-        # 5. Delete gateway target
-        target_id = find_existing_target(agentcore_client, gateway_id, MCP_TARGET_NAME)
-        if target_id:
-            logger.info('Deleting MCP gateway target: %s (%s)', MCP_TARGET_NAME, target_id)
-            try:
-                agentcore_client.delete_gateway_target(
-                    gatewayIdentifier=gateway_id, targetId=target_id,
-                )
-                logger.info('Gateway target deleted (may take a moment).')
-                time.sleep(10)
-            except Exception as e:
-                logger.warning('Could not delete gateway target: %s', e)
+    def delete_prompt():
+        prompt_id, _ = find_existing_prompt(qconnect_client, assistant_id, names.orchestration_prompt)
+        if not prompt_id:
+            logger.info('AI Prompt not found — nothing to delete.')
+            return
+        logger.info('Deleting AI Prompt: %s (%s)', names.orchestration_prompt, prompt_id)
+        try:
+            qconnect_client.delete_ai_prompt(
+                assistantId=assistant_id, aiPromptId=prompt_id,
+            )
+            _clear_ai_name_index()
+            logger.info('AI Prompt deleted.')
+        except Exception as e:
+            logger.warning('Could not delete AI Prompt: %s', e)
 
-        # 6. Delete gateway
+    def delete_association():
+        assoc_id = find_existing_connect_association(
+            connect_client, connect_instance_id, app_arn,
+        )
+        if not assoc_id:
+            return
+        logger.info('Deleting Connect integration association: %s', assoc_id)
+        try:
+            connect_client.delete_integration_association(
+                InstanceId=connect_instance_id,
+                IntegrationAssociationId=assoc_id,
+            )
+            _list_connect_associations.cache_clear()
+            logger.info('Integration association deleted.')
+        except Exception as e:
+            logger.warning('Could not delete integration association: %s', e)
+
+    def delete_gateway_target():
+        target_id = find_existing_target(agentcore_client, gateway_id, names.mcp_target)
+        if not target_id:
+            return
+        logger.info('Deleting MCP gateway target: %s (%s)', names.mcp_target, target_id)
+        try:
+            agentcore_client.delete_gateway_target(
+                gatewayIdentifier=gateway_id, targetId=target_id,
+            )
+            _list_gateway_targets.cache_clear()
+            logger.info('Gateway target deleted (may take a moment).')
+        except Exception as e:
+            logger.warning('Could not delete gateway target: %s', e)
+            return
+
+        def target_gone():
+            _list_gateway_targets.cache_clear()
+            return find_existing_target(agentcore_client, gateway_id, names.mcp_target) is None
+
+        if not wait_until(target_gone):
+            logger.warning('Gateway target still listed — continuing anyway.')
+
+    # --- Level 3 ---
+
+    def delete_app():
+        logger.info('Deleting MCP app integration: %s', app_arn)
+        try:
+            appintegrations_client.delete_application(Arn=app_arn)
+            _list_applications.cache_clear()
+            logger.info('App integration deleted.')
+        except Exception as e:
+            logger.warning('Could not delete app integration: %s', e)
+
+    def delete_gateway():
         logger.info('Deleting MCP gateway: %s', gateway_id)
         try:
             agentcore_client.delete_gateway(gatewayIdentifier=gateway_id)
+            _get_gateway.cache_clear()
             logger.info('MCP gateway deleted (may take a moment).')
-            time.sleep(5)
         except Exception as e:
             logger.warning('Could not delete MCP gateway: %s', e)
+            return
 
-    # --- 7. Delete API key credential ---
-    try:
-        agentcore_client = session.client('bedrock-agentcore-control')
-        logger.info('Deleting API key credential: %s', API_KEY_CREDENTIAL_NAME)
-        agentcore_client.delete_api_key_credential_provider(
-            name=API_KEY_CREDENTIAL_NAME,
-        )
-        logger.info('API key credential deleted.')
-    except Exception as e:
-        logger.warning('Could not delete API key credential: %s', e)
+        def gateway_gone():
+            try:
+                agentcore_client.get_gateway(gatewayIdentifier=gateway_id)
+            except ClientError as e:
+                return e.response.get('Error', {}).get('Code') == 'ResourceNotFoundException'
+            return False
 
-    # --- 8. Delete CloudFormation stack ---
+        if not wait_until(gateway_gone):
+            logger.warning('MCP gateway still exists — continuing anyway.')
+
+    def delete_api_key_credential():
+        try:
+            agentcore_client = get_client(session, 'bedrock-agentcore-control')
+            logger.info('Deleting API key credential: %s', names.api_key_credential)
+            agentcore_client.delete_api_key_credential_provider(
+                name=names.api_key_credential,
+            )
+            _api_key_cred_index.cache_clear()
+            logger.info('API key credential deleted.')
+        except Exception as e:
+            logger.warning('Could not delete API key credential: %s', e)
+
+    run_in_parallel([
+        assistant_id and delete_agent,
+        connect_instance_id and clear_security_profile,
+        connect_instance_id and delete_task_template,
+        connect_instance_id and archive_task_flow,
+        connect_instance_id and deactivate_case_template,
+    ])
+    # The agent references the prompt, so the prompt goes once the agent is gone
+    run_in_parallel([
+        assistant_id and delete_prompt,
+        app_arn and delete_association,
+        gateway_id and delete_gateway_target,
+    ])
+    run_in_parallel([
+        app_arn and delete_app,
+        gateway_id and delete_gateway,
+        delete_api_key_credential,
+    ])
+
+    # --- Level 4: Delete CloudFormation stack ---
     if stack_exists(cf_client, stack_name):
-        delete_stack(cf_client, stack_name)
+        if delete_stack(cf_client, stack_name, timeout=stack_timeout) != 'DELETE_COMPLETE':
+            return False
     else:
         logger.info('CloudFormation stack already deleted.')
 
@@ -473,6 +700,7 @@ def teardown_all(session, stack_name, connect_instance_id, region,
     logger.info('=' * 60)
     logger.info('Teardown complete for: %s', stack_name)
     logger.info('=' * 60)
+    return True
 
 
 # ---------------------------------------------------------------------------
@@ -480,24 +708,38 @@ def teardown_all(session, stack_name, connect_instance_id, region,
 # ---------------------------------------------------------------------------
 
 
+LAMBDA_ZIP_SPOOL_SIZE = 8 * 1024 * 1024  # spill to disk above 8 MB
+LAMBDA_SKIP_DIRS = frozenset({'__pycache__'})
+LAMBDA_SKIP_SUFFIXES = ('.pyc',)
+
+
+def _iter_lambda_files(dir_path, rel=''):
+    """Yield (full_path, arc_name) for every file to ship, via os.scandir."""
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            arc_name = f'{rel}/{entry.name}' if rel else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in LAMBDA_SKIP_DIRS:
+                    yield from _iter_lambda_files(entry.path, arc_name)
+            elif not entry.name.endswith(LAMBDA_SKIP_SUFFIXES):
+                yield entry.path, arc_name
+
+
 def package_lambda(code_dir):
-    buf = io.BytesIO()
-    with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for root, dirs, files in os.walk(code_dir):
-            dirs[:] = [d for d in dirs if d != '__pycache__']
-            for f in files:
-                if f.endswith('.pyc'):
-                    continue
-                full_path = os.path.join(root, f)
-                arc_name = os.path.relpath(full_path, code_dir)
-                zf.write(full_path, arc_name)
+    """Zip code_dir into a spooled temp file, rewound and ready to read."""
+    buf = tempfile.SpooledTemporaryFile(max_size=LAMBDA_ZIP_SPOOL_SIZE)
+    with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zf:
+        for full_path, arc_name in _iter_lambda_files(code_dir):
+            zf.write(full_path, arc_name)
     buf.seek(0)
-    return buf.read()
+    return buf
 
 
 def update_lambda_code(lambda_client, function_name, code_dir):
     logger.info('Packaging Lambda code from %s...', code_dir)
-    zip_bytes = package_lambda(code_dir)
+    # UpdateFunctionCode takes the zip inline, so read it exactly once here
+    with package_lambda(code_dir) as buf:
+        zip_bytes = buf.read()
     logger.info('Zip size: %s bytes', f'{len(zip_bytes):,}')
     logger.info('Updating function: %s...', function_name)
     resp = lambda_client.update_function_code(
@@ -519,7 +761,7 @@ def redeploy_api_gateway(session, api_id, stage_name):
     because the Deployment resource properties are unchanged.  This forces
     a fresh deployment so new paths/methods take effect.
     """
-    apigw_client = session.client('apigateway')
+    apigw_client = get_client(session, 'apigateway')
     logger.info('Creating new API Gateway deployment for %s (stage: %s)...', api_id, stage_name)
     resp = apigw_client.create_deployment(
         restApiId=api_id,
@@ -534,18 +776,32 @@ def redeploy_api_gateway(session, api_id, stage_name):
 # ---------------------------------------------------------------------------
 
 
-def upload_openapi_spec(s3_client, bucket_name, api_base_url):
-    with open(OPENAPI_SPEC_TEMPLATE, 'r') as f:
-        spec_content = f.read()
+@functools.lru_cache(maxsize=1)
+def _read_openapi_template():
+    """Raw OpenAPI spec template bytes, read from disk once per process."""
+    with open(OPENAPI_SPEC_TEMPLATE, 'rb') as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=4)
+def _render_openapi_spec(api_base_url):
+    """OpenAPI spec with the API URL filled in, as UTF-8 bytes."""
     # Support both old and new placeholder conventions
-    spec_content = spec_content.replace('${SERVER_URL}', api_base_url)
-    spec_content = spec_content.replace('${API_GATEWAY_URL}', api_base_url)
+    url = api_base_url.encode('utf-8')
+    return (
+        _read_openapi_template()
+        .replace(b'${SERVER_URL}', url)
+        .replace(b'${API_GATEWAY_URL}', url)
+    )
+
+
+def upload_openapi_spec(s3_client, bucket_name, api_base_url):
     s3_uri = f's3://{bucket_name}/{OPENAPI_S3_KEY}'
     logger.info('Uploading OpenAPI spec to %s...', s3_uri)
     s3_client.put_object(
         Bucket=bucket_name,
         Key=OPENAPI_S3_KEY,
-        Body=spec_content.encode('utf-8'),
+        Body=_render_openapi_spec(api_base_url),
         ContentType='application/x-yaml',
     )
     logger.info('OpenAPI spec uploaded.')
@@ -562,19 +818,27 @@ def get_api_key_value(apigw_client, api_key_id):
     return resp['value']
 
 
+@functools.lru_cache(maxsize=None)
+def _api_key_cred_index(agentcore_client):
+    """Map of API key credential name -> ARN, listed once. Cleared after create/delete."""
+    resp = agentcore_client.list_api_key_credential_providers()
+    return {
+        cred.get('name'): cred['credentialProviderArn']
+        for cred in resp.get('credentialProviders', [])
+    }
+
+
 def register_api_key_credential(agentcore_client, credential_name, api_key_value):
     try:
-        resp = agentcore_client.list_api_key_credential_providers()
-        for cred in resp.get('credentialProviders', []):
-            if cred.get('name') == credential_name:
-                cred_arn = cred['credentialProviderArn']
-                logger.info('API key credential already exists: %s', cred_arn)
-                agentcore_client.update_api_key_credential_provider(
-                    name=credential_name,
-                    apiKey=api_key_value,
-                )
-                logger.info('API key credential updated.')
-                return cred_arn
+        cred_arn = _api_key_cred_index(agentcore_client).get(credential_name)
+        if cred_arn:
+            logger.info('API key credential already exists: %s', cred_arn)
+            agentcore_client.update_api_key_credential_provider(
+                name=credential_name,
+                apiKey=api_key_value,
+            )
+            logger.info('API key credential updated.')
+            return cred_arn
     except ClientError:
         logger.debug('Could not list API key credentials', exc_info=True)
 
@@ -583,6 +847,7 @@ def register_api_key_credential(agentcore_client, credential_name, api_key_value
         name=credential_name,
         apiKey=api_key_value,
     )
+    _api_key_cred_index.cache_clear()
     cred_arn = resp['credentialProviderArn']
     logger.info('Registered. ARN: %s', cred_arn)
     return cred_arn
@@ -593,11 +858,16 @@ def register_api_key_credential(agentcore_client, credential_name, api_key_value
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=None)
+def _list_gateway_targets(agentcore_client, gateway_id):
+    """Gateway targets, listed once per gateway. Cleared after create/delete."""
+    resp = agentcore_client.list_gateway_targets(gatewayIdentifier=gateway_id)
+    return tuple(resp.get('targets', []) or resp.get('items', []))
+
+
 def find_existing_target(agentcore_client, gateway_id, target_name):
     try:
-        resp = agentcore_client.list_gateway_targets(gatewayIdentifier=gateway_id)
-        targets = resp.get('targets', []) or resp.get('items', [])
-        for t in targets:
+        for t in _list_gateway_targets(agentcore_client, gateway_id):
             if t.get('name') == target_name:
                 return t.get('targetId')
     except ClientError:
@@ -654,12 +924,12 @@ def create_or_update_mcp_target(agentcore_client, gateway_id, target_name,
             targetConfiguration=target_config,
             credentialProviderConfigurations=cred_config,
         )
+        _list_gateway_targets.cache_clear()
         target_id = resp.get('targetId', 'N/A')
         logger.info('Target created. ID: %s', target_id)
         return target_id
-    except Exception as e:
-        err_str = str(e).lower()
-        if 'already exists' in err_str or 'conflict' in err_str or 'duplicate' in err_str:
+    except ClientError as e:
+        if is_already_exists(e):
             logger.info('Target already exists.')
             return None
         raise
@@ -670,9 +940,15 @@ def create_or_update_mcp_target(agentcore_client, gateway_id, target_name,
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=8)
+def _get_gateway(agentcore_client, gateway_id):
+    """get_gateway snapshot, fetched once. Cleared after update/delete."""
+    return agentcore_client.get_gateway(gatewayIdentifier=gateway_id)
+
+
 def update_gateway_audience(session, gateway_id, connect_instance_url):
-    agentcore_client = session.client('bedrock-agentcore-control')
-    gw = agentcore_client.get_gateway(gatewayIdentifier=gateway_id)
+    agentcore_client = get_client(session, 'bedrock-agentcore-control')
+    gw = _get_gateway(agentcore_client, gateway_id)
     current_auth_type = gw.get('authorizerType', '')
     if current_auth_type != 'CUSTOM_JWT':
         logger.info('Gateway auth is %s — no audience update needed.', current_auth_type)
@@ -698,6 +974,8 @@ def update_gateway_audience(session, gateway_id, connect_instance_url):
     if not discovery_ok:
         logger.info('Updating DiscoveryUrl from %s to %s...', current_discovery_url, correct_discovery_url)
 
+    # UpdateGateway has no partial form: name, roleArn, protocolType and
+    # authorizerType are required, so they are carried over from get_gateway.
     update_kwargs = {
         'gatewayIdentifier': gateway_id,
         'name': gw['name'],
@@ -714,6 +992,7 @@ def update_gateway_audience(session, gateway_id, connect_instance_url):
     if gw.get('exceptionLevel'):
         update_kwargs['exceptionLevel'] = gw['exceptionLevel']
     agentcore_client.update_gateway(**update_kwargs)
+    _get_gateway.cache_clear()
     logger.info('AllowedAudience updated to Gateway ID.')
 
 
@@ -722,40 +1001,79 @@ def update_gateway_audience(session, gateway_id, connect_instance_url):
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=None)
+def _list_applications(appintegrations_client):
+    """All AppIntegrations applications, listed once. Cleared after create/delete."""
+    paginator = appintegrations_client.get_paginator('list_applications')
+    return tuple(
+        app
+        for page in paginator.paginate()
+        for app in page.get('Applications', [])
+    )
+
+
 def find_existing_mcp_app(appintegrations_client, namespace, app_name):
     try:
-        paginator = appintegrations_client.get_paginator('list_applications')
-        for page in paginator.paginate():
-            for app in page.get('Applications', []):
-                if app.get('Namespace') == namespace or app.get('Name') == app_name:
-                    return app.get('Arn'), app.get('Id')
+        for app in _list_applications(appintegrations_client):
+            if app.get('Namespace') == namespace or app.get('Name') == app_name:
+                return app.get('Arn'), app.get('Id')
     except ClientError:
         logger.debug('Could not list existing applications', exc_info=True)
     return None, None
 
 
-def find_existing_connect_association(connect_client, instance_id, app_arn):
-    try:
-        paginator = connect_client.get_paginator('list_integration_associations')
+@functools.lru_cache(maxsize=8)
+def _list_connect_associations(connect_client, instance_id):
+    """APPLICATION associations on a Connect instance, listed once. Cleared after create/delete."""
+    paginator = connect_client.get_paginator('list_integration_associations')
+    return tuple(
+        assoc
         for page in paginator.paginate(
             InstanceId=instance_id,
             IntegrationType='APPLICATION',
-        ):
-            for assoc in page.get('IntegrationAssociationSummaryList', []):
-                if assoc.get('IntegrationArn') == app_arn:
-                    return assoc.get('IntegrationAssociationId')
+        )
+        for assoc in page.get('IntegrationAssociationSummaryList', [])
+    )
+
+
+def find_existing_connect_association(connect_client, instance_id, app_arn):
+    try:
+        for assoc in _list_connect_associations(connect_client, instance_id):
+            if assoc.get('IntegrationArn') == app_arn:
+                return assoc.get('IntegrationAssociationId')
     except ClientError:
         logger.debug('Could not list integration associations', exc_info=True)
     return None
 
 
+@functools.lru_cache(maxsize=None)
+def _describe_instance_url(session, instance_id):
+    """DescribeInstance once per instance; failures raise and are not cached."""
+    connect_client = get_client(session, 'connect')
+    resp = connect_client.describe_instance(InstanceId=instance_id)
+    return resp['Instance'].get('InstanceAccessUrl', '')
+
+
+def get_connect_instance_url(session, instance_id):
+    """Return the instance access URL, defaulting to the my.connect.aws domain.
+
+    The URL does not change during a run, so a successful lookup is reused;
+    a failed one is retried on the next call.
+    """
+    try:
+        url = _describe_instance_url(session, instance_id)
+    except Exception as e:
+        logger.warning('Could not describe Connect instance: %s', e)
+        url = ''
+    return url or f'https://{instance_id}.my.connect.aws'
+
+
 def register_mcp_with_connect(session, connect_instance_id, gateway_url,
-                               gateway_id, stack_name):
-    appintegrations_client = session.client('appintegrations')
-    connect_client = session.client('connect')
+                               gateway_id, app_name):
+    appintegrations_client = get_client(session, 'appintegrations')
+    connect_client = get_client(session, 'connect')
 
     namespace = gateway_id
-    app_name = f'{stack_name} MCP Server'
 
     existing_arn, _ = find_existing_mcp_app(appintegrations_client, namespace, app_name)
     if existing_arn:
@@ -773,6 +1091,7 @@ def register_mcp_with_connect(session, connect_instance_id, gateway_url,
             },
             Permissions=[],
         )
+        _list_applications.cache_clear()
         app_arn = resp['Arn']
         logger.info('Created. ARN: %s', app_arn)
 
@@ -788,6 +1107,7 @@ def register_mcp_with_connect(session, connect_instance_id, gateway_url,
             IntegrationType='APPLICATION',
             IntegrationArn=app_arn,
         )
+        _list_connect_associations.cache_clear()
         logger.info('Associated. ID: %s', assoc_resp['IntegrationAssociationId'])
 
     return app_arn
@@ -798,16 +1118,27 @@ def register_mcp_with_connect(session, connect_instance_id, gateway_url,
 # ---------------------------------------------------------------------------
 
 
-def find_or_create_security_profile(connect_client, instance_id, profile_name=None):
-    profile_name = profile_name or SECURITY_PROFILE_NAME
+@functools.lru_cache(maxsize=None)
+def find_security_profile_id(connect_client, instance_id, profile_name):
+    """Look up a security profile ID by name (None if absent). Cached per name."""
+    paginator = connect_client.get_paginator('list_security_profiles')
+    # Largest page the API allows; returning on a match stops further pages.
+    for page in paginator.paginate(
+        InstanceId=instance_id,
+        PaginationConfig={'PageSize': 1000},
+    ):
+        for sp in page.get('SecurityProfileSummaryList', []):
+            if sp.get('Name') == profile_name:
+                return sp['Id']
+    return None
+
+
+def find_or_create_security_profile(connect_client, instance_id, profile_name):
     try:
-        paginator = connect_client.get_paginator('list_security_profiles')
-        for page in paginator.paginate(InstanceId=instance_id):
-            for sp in page.get('SecurityProfileSummaryList', []):
-                if sp.get('Name') == profile_name:
-                    logger.info('Security profile found: %s (ID: %s)',
-                                profile_name, sp['Id'])
-                    return sp['Id']
+        sp_id = find_security_profile_id(connect_client, instance_id, profile_name)
+        if sp_id:
+            logger.info('Security profile found: %s (ID: %s)', profile_name, sp_id)
+            return sp_id
     except ClientError:
         logger.debug('Could not list security profiles', exc_info=True)
 
@@ -818,17 +1149,18 @@ def find_or_create_security_profile(connect_client, instance_id, profile_name=No
             Description='Security profile for Stability360 Actions AI Agent with MCP tool access',
             InstanceId=instance_id,
         )
+        find_security_profile_id.cache_clear()
         sp_id = resp.get('SecurityProfileId')
         logger.info('Security profile created: %s', sp_id)
         return sp_id
-    except Exception as e:
+    except (ClientError, BotoCoreError) as e:
         logger.warning('Could not create security profile: %s', e)
         return None
 
 
 def update_security_profile_tools(connect_client, instance_id,
                                    security_profile_id, gateway_namespace,
-                                   tool_names):
+                                   tool_names, profile_name):
     logger.info('Updating security profile with MCP tool access...')
     logger.info('  Security profile ID: %s', security_profile_id)
     logger.info('  Gateway namespace:   %s', gateway_namespace)
@@ -847,10 +1179,10 @@ def update_security_profile_tools(connect_client, instance_id,
             ],
         )
         logger.info('Security profile updated with MCP tool permissions.')
-    except Exception as e:
+    except (ClientError, BotoCoreError) as e:
         logger.warning('Could not update security profile tools: %s', e)
         logger.info('You may need to add MCP tool access manually:')
-        logger.info('  Users → Security profiles → %s → Tools', SECURITY_PROFILE_NAME)
+        logger.info('  Users → Security profiles → %s → Tools', profile_name)
 
 
 # ---------------------------------------------------------------------------
@@ -860,7 +1192,7 @@ def update_security_profile_tools(connect_client, instance_id,
 
 def find_qconnect_assistant(session, connect_instance_id):
     if connect_instance_id:
-        connect_client = session.client('connect')
+        connect_client = get_client(session, 'connect')
         try:
             paginator = connect_client.get_paginator('list_integration_associations')
             for page in paginator.paginate(
@@ -870,14 +1202,15 @@ def find_qconnect_assistant(session, connect_instance_id):
                 for assoc in page.get('IntegrationAssociationSummaryList', []):
                     arn = assoc.get('IntegrationArn', '')
                     if arn:
-                        assistant_id = arn.split('/')[-1] if '/' in arn else None
+                        _, sep, assistant_id = arn.rpartition('/')
+                        assistant_id = assistant_id if sep else None
                         logger.info('Found Q Connect assistant: %s', assistant_id)
                         return assistant_id, arn
         except ClientError:
             logger.debug('Could not list WISDOM_ASSISTANT associations', exc_info=True)
     else:
         try:
-            qconnect_client = session.client('qconnect')
+            qconnect_client = get_client(session, 'qconnect')
             resp = qconnect_client.list_assistants()
             assistants = resp.get('assistantSummaries', [])
             if assistants:
@@ -894,20 +1227,87 @@ def find_qconnect_assistant(session, connect_instance_id):
 # ---------------------------------------------------------------------------
 
 
+# list operation, summary key, ID field and ARN field per Q Connect AI resource
+_AI_RESOURCE_LISTINGS = {
+    'prompt': ('list_ai_prompts', 'aiPromptSummaries', 'aiPromptId', 'aiPromptArn'),
+    'agent': ('list_ai_agents', 'aiAgentSummaries', 'aiAgentId', 'aiAgentArn'),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _ai_name_index(qconnect_client, assistant_id, kind):
+    """Map of name -> (id, arn) for an assistant's AI prompts or agents.
+
+    Listed once per (assistant, kind). Cleared after create/delete.
+    """
+    operation, key, id_field, arn_field = _AI_RESOURCE_LISTINGS[kind]
+    paginator = qconnect_client.get_paginator(operation)
+    index = {}
+    # 100 is the service maximum page size for both list operations
+    for page in paginator.paginate(
+        assistantId=assistant_id,
+        PaginationConfig={'PageSize': 100},
+    ):
+        for item in page.get(key, []):
+            index.setdefault(item.get('name'), (item.get(id_field), item.get(arn_field)))
+    return index
+
+
+# Background index builds, so a cache clear can wait for them first
+_ai_name_prefetches = []
+
+
+def prefetch_ai_name_indexes(qconnect_client, assistant_id):
+    """Start building the prompt and agent name indexes in the background."""
+    for kind in _AI_RESOURCE_LISTINGS:
+        _ai_name_prefetches.append(
+            LOOKUP_POOL.submit(_ai_name_index, qconnect_client, assistant_id, kind)
+        )
+
+
+def _clear_ai_name_index():
+    """Drop the cached name indexes after any background prefetch finishes.
+
+    lru_cache is not single-flight: a prefetch still listing when the cache
+    is cleared would store its stale index afterwards.
+    """
+    for future in list(_ai_name_prefetches):
+        future.exception()  # wait only; a failed prefetch caches nothing
+    _ai_name_index.cache_clear()
+
+
 def find_existing_prompt(qconnect_client, assistant_id, prompt_name):
     try:
-        resp = qconnect_client.list_ai_prompts(assistantId=assistant_id)
-        for p in resp.get('aiPromptSummaries', []):
-            if p.get('name') == prompt_name:
-                return p.get('aiPromptId'), p.get('aiPromptArn')
+        return _ai_name_index(qconnect_client, assistant_id, 'prompt').get(
+            prompt_name, (None, None),
+        )
     except ClientError:
         logger.debug('Could not list AI prompts', exc_info=True)
     return None, None
 
 
+def _read_published_prompt(prompt_file):
+    """Return (sha256, prompt_id) recorded for the last publish of prompt_file."""
+    try:
+        with open(f'{prompt_file}.sha256', 'r') as f:
+            digest, prompt_id = f.read().split()
+        return digest, prompt_id
+    except (OSError, ValueError):
+        return None, None
+
+
+def _record_published_prompt(prompt_file, digest, prompt_id):
+    """Record the hash of prompt_file next to it after a successful publish."""
+    try:
+        with open(f'{prompt_file}.sha256', 'w') as f:
+            f.write(f'{digest} {prompt_id}\n')
+    except OSError:
+        logger.debug('Could not record prompt hash', exc_info=True)
+
+
 def create_or_update_orchestration_prompt(session, assistant_id, prompt_name,
                                            prompt_file, model_id):
-    qconnect_client = session.client('qconnect')
+    qconnect_client = get_client(session, 'qconnect')
 
     if not os.path.isfile(prompt_file):
         logger.error('Prompt file not found: %s', prompt_file)
@@ -918,13 +1318,31 @@ def create_or_update_orchestration_prompt(session, assistant_id, prompt_name,
 
     logger.info('Prompt content loaded (%d chars) from %s', len(prompt_text), prompt_file)
 
-    existing_id, _ = find_existing_prompt(qconnect_client, assistant_id, prompt_name)
-
     template_config = {
         'textFullAIPromptEditTemplateConfiguration': {
             'text': prompt_text,
         }
     }
+    prompt_settings = {
+        'type': 'ORCHESTRATION',
+        'modelId': model_id,
+        'apiFormat': 'MESSAGES',
+        'templateType': 'TEXT',
+    }
+    # Hash everything that defines the published prompt, not just its text,
+    # so a model or format change is never skipped as "unchanged"
+    digest = hashlib.sha256(json.dumps(
+        {'templateConfiguration': template_config, **prompt_settings},
+        sort_keys=True, separators=(',', ':'),
+    ).encode('utf-8')).hexdigest()
+
+    existing_id, _ = find_existing_prompt(qconnect_client, assistant_id, prompt_name)
+
+    # The sidecar stores the prompt ID too, so a different stack or
+    # assistant never matches a hash recorded for another prompt.
+    if existing_id and _read_published_prompt(prompt_file) == (digest, existing_id):
+        logger.info('Prompt unchanged since last publish — skipping update.')
+        return f'{existing_id}:$LATEST'
 
     if existing_id:
         logger.info('Prompt already exists: %s — updating...', existing_id)
@@ -936,7 +1354,7 @@ def create_or_update_orchestration_prompt(session, assistant_id, prompt_name,
                 visibilityStatus='PUBLISHED',
             )
             logger.info('Prompt updated.')
-        except Exception as e:
+        except (ClientError, BotoCoreError) as e:
             logger.warning('Could not update prompt: %s', e)
             return f'{existing_id}:$LATEST'
 
@@ -950,6 +1368,7 @@ def create_or_update_orchestration_prompt(session, assistant_id, prompt_name,
             # Version creation may fail if content hasn't changed — that's OK
             logger.debug('Could not create prompt version: %s', e)
 
+        _record_published_prompt(prompt_file, digest, existing_id)
         return f'{existing_id}:$LATEST'
 
     logger.info('Creating orchestration prompt: %s', prompt_name)
@@ -958,13 +1377,11 @@ def create_or_update_orchestration_prompt(session, assistant_id, prompt_name,
         resp = qconnect_client.create_ai_prompt(
             assistantId=assistant_id,
             name=prompt_name,
-            type='ORCHESTRATION',
-            modelId=model_id,
-            apiFormat='MESSAGES',
-            templateType='TEXT',
             templateConfiguration=template_config,
+            **prompt_settings,
             visibilityStatus='PUBLISHED',
         )
+        _clear_ai_name_index()
         prompt_id = resp.get('aiPrompt', {}).get('aiPromptId', 'N/A')
         logger.info('Prompt created. ID: %s', prompt_id)
 
@@ -976,10 +1393,12 @@ def create_or_update_orchestration_prompt(session, assistant_id, prompt_name,
         except ClientError:
             logger.warning('Could not create prompt version', exc_info=True)
 
+        _record_published_prompt(prompt_file, digest, prompt_id)
         return f'{prompt_id}:$LATEST'
-    except Exception as e:
-        err_str = str(e).lower()
-        if 'already exists' in err_str or 'conflict' in err_str:
+    except (ClientError, BotoCoreError) as e:
+        if is_already_exists(e):
+            # The cached index predates the conflicting prompt — re-list once
+            _clear_ai_name_index()
             existing_id, _ = find_existing_prompt(
                 qconnect_client, assistant_id, prompt_name,
             )
@@ -995,21 +1414,26 @@ def create_or_update_orchestration_prompt(session, assistant_id, prompt_name,
 
 def find_existing_ai_agent(qconnect_client, assistant_id, agent_name):
     try:
-        resp = qconnect_client.list_ai_agents(assistantId=assistant_id)
-        for agent in resp.get('aiAgentSummaries', []):
-            if agent.get('name') == agent_name:
-                return agent.get('aiAgentId'), agent.get('aiAgentArn')
+        return _ai_name_index(qconnect_client, assistant_id, 'agent').get(
+            agent_name, (None, None),
+        )
     except ClientError:
         logger.debug('Could not list AI agents', exc_info=True)
     return None, None
 
 
+@functools.lru_cache(maxsize=8)
+def _list_assistant_associations(qconnect_client, assistant_id):
+    """Assistant associations, listed once per assistant."""
+    resp = qconnect_client.list_assistant_associations(
+        assistantId=assistant_id,
+    )
+    return tuple(resp.get('assistantAssociationSummaries', []))
+
+
 def find_existing_kb_association(qconnect_client, assistant_id):
     try:
-        resp = qconnect_client.list_assistant_associations(
-            assistantId=assistant_id,
-        )
-        for assoc in resp.get('assistantAssociationSummaries', []):
+        for assoc in _list_assistant_associations(qconnect_client, assistant_id):
             if assoc.get('associationType') == 'KNOWLEDGE_BASE':
                 assoc_id = assoc.get('assistantAssociationId')
                 kb_data = assoc.get('associationData', {}).get(
@@ -1022,6 +1446,13 @@ def find_existing_kb_association(qconnect_client, assistant_id):
     return None, None
 
 
+def _json_string(obj):
+    """Serialize obj to a compact JSON str (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'))
+
+
 def _build_retrieve_override_values(assistant_id, kb_association_id):
     return [
         {
@@ -1033,128 +1464,153 @@ def _build_retrieve_override_values(assistant_id, kb_association_id):
             'value': {
                 'constant': {
                     'type': 'JSON_STRING',
-                    'value': json.dumps([kb_association_id]),
+                    'value': _json_string([kb_association_id]),
                 },
             },
         },
     ]
 
 
-def _build_agent_tool_configurations(gateway_id, assistant_id=None,
-                                      kb_association_id=None):
+_COMPLETE_TOOL = {
+    'toolName': 'Complete',
+    'toolType': 'RETURN_TO_CONTROL',
+    'description': 'Close conversation when customer has no more questions',
+    'instruction': {
+        'instruction': (
+            'Mark the conversation as complete ONLY after confirming '
+            'the customer has no additional questions or needs. Always '
+            'ask if there is anything else you can help with before '
+            'using this tool.'
+        ),
+    },
+    'inputSchema': {
+        'type': 'object',
+        'properties': {
+            'reason': {
+                'type': 'string',
+                'description': 'Reason of completion',
+            },
+        },
+        'required': ['reason'],
+    },
+}
+
+_ESCALATE_TOOL = {
+    'toolName': 'Escalate',
+    'toolType': 'RETURN_TO_CONTROL',
+    'description': 'Escalate to human agent when the issue cannot be resolved by AI',
+    'instruction': {
+        'instruction': (
+            'Escalate the conversation to a human agent when the '
+            'customer explicitly requests it, when you cannot resolve '
+            'their issue, or when the situation requires human judgment. '
+            'Always inform the customer that you are transferring them.'
+        ),
+    },
+    'inputSchema': {
+        'type': 'object',
+        'properties': {
+            'reason': {
+                'type': 'string',
+                'description': 'Reason for escalation',
+            },
+        },
+        'required': ['reason'],
+    },
+}
+
+_RETRIEVE_TOOL_BASE = {
+    'toolName': 'Retrieve',
+    'toolType': 'MODEL_CONTEXT_PROTOCOL',
+    'toolId': 'aws_service__qconnect_Retrieve',
+    'instruction': {
+        'instruction': RETRIEVE_TOOL_INSTRUCTION,
+        'examples': RETRIEVE_TOOL_EXAMPLES,
+    },
+}
+
+# Instruction block for each MCP action tool, keyed by operation ID
+_INSTRUCTION_BY_OP = {
+    'resourceLookup': {'instruction': RESOURCE_LOOKUP_TOOL_INSTRUCTION},
+    'intakeHelper': {'instruction': INTAKE_HELPER_TOOL_INSTRUCTION},
+}
+
+
+def _build_agent_tool_configurations(gateway_id, mcp_target_name,
+                                      assistant_id=None, kb_association_id=None):
     """Build tool configurations for the actions agent.
 
     Includes: Complete, Escalate, Retrieve (KB), and 2 MCP action tools
-    (resourceLookup + intakeHelper).
+    (resourceLookup + intakeHelper). The static tool definitions are module
+    constants; each is shallow-copied so callers may modify the result.
     """
-    retrieve_tool = {
-        'toolName': 'Retrieve',
-        'toolType': 'MODEL_CONTEXT_PROTOCOL',
-        'toolId': 'aws_service__qconnect_Retrieve',
-        'instruction': {
-            'instruction': RETRIEVE_TOOL_INSTRUCTION,
-            'examples': RETRIEVE_TOOL_EXAMPLES,
-        },
-    }
+    retrieve_tool = {**_RETRIEVE_TOOL_BASE}
     if assistant_id and kb_association_id:
         retrieve_tool['overrideInputValues'] = _build_retrieve_override_values(
             assistant_id, kb_association_id,
         )
 
-    tools = [
-        {
-            'toolName': 'Complete',
-            'toolType': 'RETURN_TO_CONTROL',
-            'description': 'Close conversation when customer has no more questions',
-            'instruction': {
-                'instruction': (
-                    'Mark the conversation as complete ONLY after confirming '
-                    'the customer has no additional questions or needs. Always '
-                    'ask if there is anything else you can help with before '
-                    'using this tool.'
-                ),
-            },
-            'inputSchema': {
-                'type': 'object',
-                'properties': {
-                    'reason': {
-                        'type': 'string',
-                        'description': 'Reason of completion',
-                    },
-                },
-                'required': ['reason'],
-            },
-        },
-        {
-            'toolName': 'Escalate',
-            'toolType': 'RETURN_TO_CONTROL',
-            'description': 'Escalate to human agent when the issue cannot be resolved by AI',
-            'instruction': {
-                'instruction': (
-                    'Escalate the conversation to a human agent when the '
-                    'customer explicitly requests it, when you cannot resolve '
-                    'their issue, or when the situation requires human judgment. '
-                    'Always inform the customer that you are transferring them.'
-                ),
-            },
-            'inputSchema': {
-                'type': 'object',
-                'properties': {
-                    'reason': {
-                        'type': 'string',
-                        'description': 'Reason for escalation',
-                    },
-                },
-                'required': ['reason'],
-            },
-        },
-        retrieve_tool,
-    ]
+    tools = [{**_COMPLETE_TOOL}, {**_ESCALATE_TOOL}, retrieve_tool]
 
     # Add MCP action tools
-    tool_instructions = {
-        'resourceLookup': RESOURCE_LOOKUP_TOOL_INSTRUCTION,
-        'intakeHelper': INTAKE_HELPER_TOOL_INSTRUCTION,
-    }
-
-    for op_id in MCP_TOOL_OPERATIONS:
-        tool_name = f'{MCP_TARGET_NAME}___{op_id}'
-        tool_name_safe = tool_name.replace('-', '_')
-        mcp_tool_id = f'gateway_{gateway_id}__{tool_name}'
-
+    for op_id, tool_name, tool_name_safe in mcp_tool_names(mcp_target_name):
         tools.append({
             'toolName': tool_name_safe,
             'toolType': 'MODEL_CONTEXT_PROTOCOL',
-            'toolId': mcp_tool_id,
-            'instruction': {
-                'instruction': tool_instructions[op_id],
-            },
+            'toolId': f'gateway_{gateway_id}__{tool_name}',
+            'instruction': _INSTRUCTION_BY_OP[op_id],
         })
 
     return tools
 
 
 def _get_existing_agent_config(qconnect_client, assistant_id, agent_id):
-    """Read the existing agent config so we never lose tools during updates."""
+    """Read the existing agent config so we never lose tools during updates.
+
+    Returns (configuration, visibilityStatus); ({}, None) if it cannot be read.
+    """
     try:
         resp = qconnect_client.get_ai_agent(
             assistantId=assistant_id, aiAgentId=agent_id,
         )
-        return resp.get('aiAgent', {}).get('configuration', {})
+        agent = resp.get('aiAgent', {})
+        return agent.get('configuration', {}), agent.get('visibilityStatus')
     except ClientError:
         logger.debug('Could not read existing agent config', exc_info=True)
-        return {}
+        return {}, None
+
+
+def _sent_fields_match(sent, existing):
+    """True if every field in sent has the same value in existing.
+
+    The service echoes back extra fields (and ones MCP tools reject), so only
+    the fields we send are compared.
+    """
+    if isinstance(sent, dict):
+        return isinstance(existing, dict) and all(
+            _sent_fields_match(v, existing.get(k)) for k, v in sent.items()
+        )
+    if isinstance(sent, list):
+        return (isinstance(existing, list) and len(sent) == len(existing)
+                and all(_sent_fields_match(a, b) for a, b in zip(sent, existing)))
+    return sent == existing
+
+
+# Fields that MCP tools reject in an agent's toolConfigurations
+MCP_BLOCKED_FIELDS = ('inputSchema', 'outputSchema', 'description', 'title')
 
 
 def _strip_mcp_overrides(tools):
-    """Strip fields that MCP tools reject (inputSchema, outputSchema, description, title)."""
-    MCP_BLOCKED_FIELDS = {'inputSchema', 'outputSchema', 'description', 'title'}
-    cleaned = []
+    """Strip fields that MCP tools reject, in place, and return tools.
+
+    Callers pass freshly built or freshly fetched tool lists, so mutating
+    them is safe and avoids copying every tool dict.
+    """
     for tool in tools:
         if tool.get('toolType') == 'MODEL_CONTEXT_PROTOCOL':
-            tool = {k: v for k, v in tool.items() if k not in MCP_BLOCKED_FIELDS}
-        cleaned.append(tool)
-    return cleaned
+            for field in MCP_BLOCKED_FIELDS:
+                tool.pop(field, None)
+    return tools
 
 
 def _safe_update_ai_agent(qconnect_client, assistant_id, agent_id, config):
@@ -1163,28 +1619,34 @@ def _safe_update_ai_agent(qconnect_client, assistant_id, agent_id, config):
     The update_ai_agent API replaces the ENTIRE configuration.
     If toolConfigurations is missing, all tools get wiped. This helper
     reads the existing config first and merges tools to prevent that.
+    When the agent is already PUBLISHED with the same orchestration
+    settings, no update is sent. Returns True if the agent was updated.
     """
     orch_config = config.get('orchestrationAIAgentConfiguration', {})
     new_tools = orch_config.get('toolConfigurations')
 
+    existing_config, visibility = _get_existing_agent_config(
+        qconnect_client, assistant_id, agent_id,
+    )
+    existing_orch = existing_config.get('orchestrationAIAgentConfiguration', {})
+
     if not new_tools:
         # No tools in the new config — preserve existing ones
-        existing_config = _get_existing_agent_config(
-            qconnect_client, assistant_id, agent_id,
-        )
-        existing_orch = existing_config.get('orchestrationAIAgentConfiguration', {})
         existing_tools = existing_orch.get('toolConfigurations', [])
 
         if existing_tools:
             logger.info('Preserving %d existing tools during agent update.', len(existing_tools))
-            orch_config['toolConfigurations'] = existing_tools
+            # Copy each tool so stripping below leaves existing_config intact
+            orch_config['toolConfigurations'] = [dict(t) for t in existing_tools]
             config['orchestrationAIAgentConfiguration'] = orch_config
 
     # Strip fields that MCP tools reject
     if orch_config.get('toolConfigurations'):
-        orch_config['toolConfigurations'] = _strip_mcp_overrides(
-            orch_config['toolConfigurations'],
-        )
+        _strip_mcp_overrides(orch_config['toolConfigurations'])
+
+    if (visibility == 'PUBLISHED' and existing_orch
+            and _sent_fields_match(orch_config, existing_orch)):
+        return False
 
     qconnect_client.update_ai_agent(
         assistantId=assistant_id,
@@ -1192,11 +1654,12 @@ def _safe_update_ai_agent(qconnect_client, assistant_id, agent_id, config):
         configuration=config,
         visibilityStatus='PUBLISHED',
     )
+    return True
 
 
 def set_agent_as_default(session, assistant_id, agent_id):
     """Set an AI agent as the default ORCHESTRATION agent for the assistant."""
-    qconnect_client = session.client('qconnect')
+    qconnect_client = get_client(session, 'qconnect')
     try:
         qconnect_client.update_assistant_ai_agent(
             assistantId=assistant_id,
@@ -1213,16 +1676,36 @@ def set_agent_as_default(session, assistant_id, agent_id):
 def create_ai_agent(session, assistant_id, agent_name, description,
                      connect_instance_id, custom_prompt_id=None,
                      gateway_id=None, set_default=False,
-                     tool_configurations=None):
+                     tool_configurations=None, mcp_target_name=None):
     """Create a NEW ORCHESTRATION AI agent for the actions tools.
 
     When set_default=True, this agent becomes the default orchestration
     agent for the assistant (used by the Lex bot / contact flow).
     If tool_configurations is provided, use those instead of the default.
+    Otherwise the MCP tools are named after mcp_target_name.
     """
-    qconnect_client = session.client('qconnect')
+    qconnect_client = get_client(session, 'qconnect')
+
+    # Independent lookups: run them together, collect each where it is used
+    agent_future = LOOKUP_POOL.submit(
+        find_existing_ai_agent, qconnect_client, assistant_id, agent_name,
+    )
+    account_future = LOOKUP_POOL.submit(get_account_id, session)
+    kb_future = None
+    if not tool_configurations:
+        kb_future = LOOKUP_POOL.submit(
+            find_existing_kb_association, qconnect_client, assistant_id,
+        )
+
+    def connect_instance_arn():
+        # Resolved where it is used, so an STS failure goes through the
+        # caller's existing error handling
+        return (
+            f'arn:aws:connect:{session.region_name}:{account_future.result()}'
+            f':instance/{connect_instance_id}'
+        )
 
-    existing_id, _ = find_existing_ai_agent(qconnect_client, assistant_id, agent_name)
+    existing_id, _ = agent_future.result()
     if existing_id:
         logger.info('AI Agent already exists: %s (ID: %s) — updating config...', agent_name, existing_id)
         if custom_prompt_id or gateway_id or tool_configurations:
@@ -1230,30 +1713,30 @@ def create_ai_agent(session, assistant_id, agent_name, description,
                 if tool_configurations:
                     tools = tool_configurations
                 else:
-                    kb_assoc_id, _ = find_existing_kb_association(qconnect_client, assistant_id)
+                    kb_assoc_id, _ = kb_future.result()
                     tools = _build_agent_tool_configurations(
-                        gateway_id=gateway_id, assistant_id=assistant_id,
+                        gateway_id=gateway_id, mcp_target_name=mcp_target_name,
+                        assistant_id=assistant_id,
                         kb_association_id=kb_assoc_id,
                     )
 
-                region = session.region_name
-                account = session.client('sts').get_caller_identity()['Account']
-                connect_instance_arn = f'arn:aws:connect:{region}:{account}:instance/{connect_instance_id}'
-
                 config = {
                     'orchestrationAIAgentConfiguration': {
                         'orchestrationAIPromptId': custom_prompt_id,
                         'locale': 'en_US',
-                        'connectInstanceArn': connect_instance_arn,
+                        'connectInstanceArn': connect_instance_arn(),
                         'toolConfigurations': tools,
                     }
                 }
 
-                _safe_update_ai_agent(
+                if _safe_update_ai_agent(
                     qconnect_client, assistant_id, existing_id, config,
-                )
-                logger.info('AI Agent updated with new tools and prompt.')
-            except Exception as e:
+                ):
+                    logger.info('AI Agent updated with new tools and prompt.')
+                else:
+                    logger.info('AI Agent already published with these tools and '
+                                'prompt — skipping update.')
+            except (ClientError, BotoCoreError) as e:
                 logger.warning('Could not update agent: %s', e)
         if set_default:
             set_agent_as_default(session, assistant_id, existing_id)
@@ -1264,18 +1747,15 @@ def create_ai_agent(session, assistant_id, agent_name, description,
         logger.warning('No orchestration prompt available.')
         return None
 
-    region = session.region_name
-    account = session.client('sts').get_caller_identity()['Account']
-    connect_instance_arn = f'arn:aws:connect:{region}:{account}:instance/{connect_instance_id}'
-
     if tool_configurations:
         tools = tool_configurations
     else:
-        kb_assoc_id, _ = find_existing_kb_association(qconnect_client, assistant_id)
+        kb_assoc_id, _ = kb_future.result()
         if kb_assoc_id:
             logger.info('KB association found for Retrieve tool: %s', kb_assoc_id)
         tools = _build_agent_tool_configurations(
-            gateway_id=gateway_id, assistant_id=assistant_id,
+            gateway_id=gateway_id, mcp_target_name=mcp_target_name,
+            assistant_id=assistant_id,
             kb_association_id=kb_assoc_id,
         )
     tool_names = [t['toolName'] for t in tools]
@@ -1284,7 +1764,7 @@ def create_ai_agent(session, assistant_id, agent_name, description,
         'orchestrationAIAgentConfiguration': {
             'orchestrationAIPromptId': prompt_id,
             'locale': 'en_US',
-            'connectInstanceArn': connect_instance_arn,
+            'connectInstanceArn': connect_instance_arn(),
             'toolConfigurations': tools,
         }
     }
@@ -1303,6 +1783,7 @@ def create_ai_agent(session, assistant_id, agent_name, description,
             configuration=config,
             visibilityStatus='PUBLISHED',
         )
+        _clear_ai_name_index()
         agent_id = resp.get('aiAgent', {}).get('aiAgentId', 'N/A')
         logger.info('AI Agent created. ID: %s', agent_id)
 
@@ -1320,10 +1801,11 @@ def create_ai_agent(session, assistant_id, agent_name, description,
             logger.info('Agent created but NOT set as default.')
         return agent_id
 
-    except Exception as e:
-        err_str = str(e).lower()
-        if 'already exists' in err_str or 'conflict' in err_str:
+    except (ClientError, BotoCoreError) as e:
+        if is_already_exists(e):
             logger.info('AI Agent already exists.')
+            # The cached index predates the conflicting agent — re-list once
+            _clear_ai_name_index()
             existing_id, _ = find_existing_ai_agent(
                 qconnect_client, assistant_id, agent_name,
             )
@@ -1340,13 +1822,11 @@ def create_ai_agent(session, assistant_id, agent_name, description,
 def generate_tool_config_file(gateway_id, target_name, agent_name,
                                agent_id, assistant_id, output_path):
     tools = []
-    for op_id in MCP_TOOL_OPERATIONS:
-        tool_name = f'{target_name}___{op_id}'
-        tool_id = f'gateway_{gateway_id}__{tool_name}'
+    for op_id, tool_name, tool_name_safe in mcp_tool_names(target_name):
         tools.append({
             'operationId': op_id,
-            'toolName': tool_name.replace('-', '_'),
-            'toolId': tool_id,
+            'toolName': tool_name_safe,
+            'toolId': f'gateway_{gateway_id}__{tool_name}',
         })
 
     config = {
@@ -1364,11 +1844,28 @@ def generate_tool_config_file(gateway_id, target_name, agent_name,
         'tools': tools,
     }
 
-    with open(output_path, 'w') as f:
-        json.dump(config, f, indent=2)
+    write_json(output_path, config)
     logger.info('Tool config reference written to: %s', output_path)
 
 
+def write_json(path, obj):
+    """Write obj to path as 2-space indented JSON (orjson when available).
+
+    The document is written to a temp file in the same directory and then
+    renamed over path, so readers never see a partially written file.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2).encode('utf-8')
+    with tempfile.NamedTemporaryFile(
+        'wb', dir=os.path.dirname(path) or '.', delete=False, buffering=1 << 16,
+    ) as tmp:
+        tmp.write(data)
+    os.chmod(tmp.name, 0o644)  # NamedTemporaryFile creates files as 0600
+    os.replace(tmp.name, path)
+
+
 # ---------------------------------------------------------------------------
 # Task template + task flow + profiles/cases domain lookup
 # ---------------------------------------------------------------------------
@@ -1570,7 +2067,7 @@ def create_or_update_task_flow(connect_client, instance_id, queue_arn):
 def get_customer_profiles_domain(session, connect_instance_id):
     """Look up the Customer Profiles domain linked to this Connect instance."""
     try:
-        profiles_client = session.client('customer-profiles')
+        profiles_client = get_client(session, 'customer-profiles')
         resp = profiles_client.list_domains()
         domains = resp.get('Items', [])
         # Try to find a domain that matches the instance
@@ -1592,7 +2089,7 @@ def get_customer_profiles_domain(session, connect_instance_id):
 def get_cases_domain_id(session, connect_instance_id):
     """Look up the Cases domain ID for this Connect instance."""
     try:
-        cases_client = session.client('connectcases')
+        cases_client = get_client(session, 'connectcases')
         resp = cases_client.list_domains()
         for domain in resp.get('domains', []):
             # Cases domain ARN contains the instance ID
@@ -1617,14 +2114,20 @@ CASE_TEMPLATE_NAME = 'Stability360-Intake-Case'
 
 def create_or_find_case_template(cases_client, domain_id):
     """Create or find a Stability360 case template. Returns template_id."""
-    # Check if our template already exists
+    # Check if our template already exists — page through every template,
+    # stopping at the first page that has it
     try:
-        resp = cases_client.list_templates(domainId=domain_id, maxResults=50)
-        for t in resp.get('templates', []):
-            if t['name'] == CASE_TEMPLATE_NAME:
-                template_id = t['templateId']
-                logger.info('Case template already exists: %s (%s)', CASE_TEMPLATE_NAME, template_id)
-                return template_id
+        kwargs = {'domainId': domain_id, 'maxResults': 100}
+        while True:
+            resp = cases_client.list_templates(**kwargs)
+            for t in resp.get('templates', []):
+                if t['name'] == CASE_TEMPLATE_NAME:
+                    template_id = t['templateId']
+                    logger.info('Case template already exists: %s (%s)', CASE_TEMPLATE_NAME, template_id)
+                    return template_id
+            if not resp.get('nextToken'):
+                break
+            kwargs['nextToken'] = resp['nextToken']
     except Exception as e:
         logger.warning('Could not list case templates: %s', e)
 
@@ -1647,12 +2150,33 @@ def create_or_find_case_template(cases_client, domain_id):
         return None
 
 
-def update_lambda_env_vars(lambda_client, function_name, new_vars):
-    """Merge new environment variables into the Lambda function's existing config."""
+def get_lambda_env_vars(lambda_client, function_name):
+    """Return the Lambda function's current environment variables (None on error)."""
     try:
         current = lambda_client.get_function_configuration(FunctionName=function_name)
-        env_vars = current.get('Environment', {}).get('Variables', {})
-        env_vars.update(new_vars)
+    except (ClientError, BotoCoreError):
+        logger.debug('Could not read Lambda env vars', exc_info=True)
+        return None
+    return current.get('Environment', {}).get('Variables', {})
+
+
+def update_lambda_env_vars(lambda_client, function_name, new_vars, current_vars=None):
+    """Merge new environment variables into the Lambda function's existing config.
+
+    Skips the update when every variable already has the requested value, and
+    when the current variables cannot be read — sending only new_vars would
+    wipe everything CloudFormation set.
+    """
+    try:
+        if current_vars is None:
+            current_vars = get_lambda_env_vars(lambda_client, function_name)
+        if current_vars is None:
+            logger.warning('Could not read Lambda env vars — skipping update.')
+            return
+        env_vars = {**current_vars, **new_vars}
+        if env_vars == current_vars:
+            logger.info('Lambda env vars unchanged — skipping update.')
+            return
         lambda_client.update_function_configuration(
             FunctionName=function_name,
             Environment={'Variables': env_vars},
@@ -1662,13 +2186,33 @@ def update_lambda_env_vars(lambda_client, function_name, new_vars):
         logger.warning('Could not update Lambda env vars: %s', e)
 
 
+def _still_exists(check, label, resource_id):
+    """Run a cheap Get call for an ID saved in the Lambda env; False if it fails."""
+    try:
+        check()
+        return True
+    except (ClientError, BotoCoreError):
+        logger.info('Saved %s %s is no longer valid — looking it up again.',
+                    label, resource_id)
+        return False
+
+
 def deploy_task_resources(session, connect_instance_id, lambda_function_name, region):
     """Deploy task template, task flow, and look up profiles/cases domains.
 
     Updates Lambda env vars with the new resource IDs.
     """
-    connect_client = session.client('connect')
-    lambda_client = session.client('lambda')
+    connect_client = get_client(session, 'connect')
+    lambda_client = get_client(session, 'lambda')
+
+    # IDs discovered on a previous run for the same instance live on in the
+    # Lambda's environment, so reuse them (after a cheap existence check)
+    # instead of listing domains again.
+    current_env = get_lambda_env_vars(lambda_client, lambda_function_name)
+    if current_env is None:
+        logger.warning('Could not read Lambda env vars — skipping task resources.')
+        return {}
+    known = current_env if current_env.get('CONNECT_INSTANCE_ID') == connect_instance_id else {}
 
     new_env = {}
 
@@ -1703,7 +2247,16 @@ def deploy_task_resources(session, connect_instance_id, lambda_function_name, re
     # 4. Customer Profiles domain
     logger.info('')
     logger.info('--- Task Resources: Look up Customer Profiles domain ---')
-    profiles_domain = get_customer_profiles_domain(session, connect_instance_id)
+    profiles_domain = known.get('CUSTOMER_PROFILES_DOMAIN')
+    if profiles_domain and not _still_exists(
+        lambda: get_client(session, 'customer-profiles').get_domain(DomainName=profiles_domain),
+        'Customer Profiles domain', profiles_domain,
+    ):
+        profiles_domain = None
+    if profiles_domain:
+        logger.info('Reusing Customer Profiles domain: %s', profiles_domain)
+    else:
+        profiles_domain = get_customer_profiles_domain(session, connect_instance_id)
     if profiles_domain:
         new_env['CUSTOMER_PROFILES_DOMAIN'] = profiles_domain
     else:
@@ -1712,7 +2265,18 @@ def deploy_task_resources(session, connect_instance_id, lambda_function_name, re
     # 5. Cases domain
     logger.info('')
     logger.info('--- Task Resources: Look up Cases domain ---')
-    cases_domain_id = get_cases_domain_id(session, connect_instance_id)
+    cases_client = get_client(session, 'connectcases')
+    cases_domain_id = known.get('CONNECT_CASES_DOMAIN_ID')
+    if cases_domain_id and not _still_exists(
+        lambda: cases_client.get_domain(domainId=cases_domain_id),
+        'Cases domain', cases_domain_id,
+    ):
+        cases_domain_id = None
+    if cases_domain_id:
+        logger.info('Reusing Cases domain: %s', cases_domain_id)
+    else:
+        known = {}  # a newly discovered domain invalidates the saved template
+        cases_domain_id = get_cases_domain_id(session, connect_instance_id)
     if cases_domain_id:
         new_env['CONNECT_CASES_DOMAIN_ID'] = cases_domain_id
     else:
@@ -1722,21 +2286,36 @@ def deploy_task_resources(session, connect_instance_id, lambda_function_name, re
     if cases_domain_id:
         logger.info('')
         logger.info('--- Task Resources: Create case template ---')
-        cases_client = session.client('connectcases')
-        case_template_id = create_or_find_case_template(cases_client, cases_domain_id)
+        case_template_id = known.get('CASE_TEMPLATE_ID')
+        if case_template_id and not _still_exists(
+            lambda: cases_client.get_template(domainId=cases_domain_id,
+                                              templateId=case_template_id),
+            'case template', case_template_id,
+        ):
+            case_template_id = None
+        if case_template_id:
+            logger.info('Reusing case template: %s', case_template_id)
+        else:
+            case_template_id = create_or_find_case_template(cases_client, cases_domain_id)
         if case_template_id:
             new_env['CASE_TEMPLATE_ID'] = case_template_id
 
     # Store Connect instance ID for Lambda runtime
     new_env['CONNECT_INSTANCE_ID'] = connect_instance_id
     new_env['CONNECT_REGION'] = region
+    # Lets the Lambda build profile/contact ARNs without calling STS; optional,
+    # since the Lambda falls back to STS itself
+    try:
+        new_env['ACCOUNT_ID'] = get_account_id(session)
+    except (ClientError, BotoCoreError) as e:
+        logger.warning('Could not look up account ID — Lambda will use STS: %s', e)
 
     # 6. Update Lambda env vars
     if new_env:
         logger.info('')
         logger.info('--- Task Resources: Update Lambda env vars ---')
         time.sleep(5)  # Wait for any prior Lambda updates to settle
-        update_lambda_env_vars(lambda_client, lambda_function_name, new_env)
+        update_lambda_env_vars(lambda_client, lambda_function_name, new_env, current_env)
 
     return new_env
 
@@ -1772,10 +2351,13 @@ def main():
                         help='With --teardown: also attempt to delete the Connect security profile')
     parser.add_argument('--set-default', action='store_true',
                         help='Set the AI agent as the default orchestration agent for the assistant')
+    parser.add_argument('--stack-timeout', type=int, default=STACK_POLL_TIMEOUT,
+                        help='Seconds to wait for a CloudFormation stack operation '
+                             f'(default: {STACK_POLL_TIMEOUT})')
     args = parser.parse_args()
 
     # Init resource names
-    init_resource_names(args.stack_name)
+    names = names_for(args.stack_name)
 
     logger.info('=' * 60)
     logger.info('Stability360 Actions — Deployment')
@@ -1785,25 +2367,28 @@ def main():
     logger.info('Environment:   %s', args.environment)
 
     session = boto3.Session(region_name=args.region)
-    cf_client = session.client('cloudformation')
+    cf_client = get_client(session, 'cloudformation')
 
     # --- Teardown mode (full cleanup) ---
     if args.teardown:
         if not args.connect_instance_id:
             logger.warning('No --connect-instance-id provided — only CFN + MCP resources will be deleted.')
-        teardown_all(session, args.stack_name, args.connect_instance_id, args.region,
-                     delete_security_profile=args.delete_security_profile)
+        if not teardown_all(session, args.stack_name, args.connect_instance_id, args.region,
+                            delete_security_profile=args.delete_security_profile,
+                            stack_timeout=args.stack_timeout):
+            sys.exit(1)
         return
 
     # --- Delete mode (CFN stack only) ---
     if args.delete:
-        delete_stack(cf_client, args.stack_name)
+        if delete_stack(cf_client, args.stack_name, timeout=args.stack_timeout) != 'DELETE_COMPLETE':
+            sys.exit(1)
         return
 
     # --- Update code only ---
     if args.update_code_only:
         outputs = get_stack_outputs(cf_client, args.stack_name)
-        lambda_client = session.client('lambda')
+        lambda_client = get_client(session, 'lambda')
         update_lambda_code(lambda_client, outputs['ActionsFunctionName'], LAMBDA_CODE_DIR)
         return
 
@@ -1817,7 +2402,7 @@ def main():
             logger.error('Could not find Q Connect assistant')
             sys.exit(1)
         prompt_id = create_or_update_orchestration_prompt(
-            session, assistant_id, ORCHESTRATION_PROMPT_NAME,
+            session, assistant_id, names.orchestration_prompt,
             ORCHESTRATION_PROMPT_FILE, args.model_id,
         )
         logger.info('Prompt updated: %s', prompt_id)
@@ -1836,69 +2421,86 @@ def main():
         spec_bucket = outputs.get('SpecBucketName', '')
         api_key_id = outputs.get('ActionsApiKeyId', '')
         gateway_id = outputs.get('McpGatewayId', '')
-        connect_instance_url = ''
-        try:
-            connect_client = session.client('connect')
-            resp = connect_client.describe_instance(InstanceId=args.connect_instance_id)
-            connect_instance_url = resp['Instance'].get('InstanceAccessUrl', '')
-            if not connect_instance_url:
-                connect_instance_url = f'https://{args.connect_instance_id}.my.connect.aws'
-        except Exception:
-            connect_instance_url = f'https://{args.connect_instance_id}.my.connect.aws'
+        api_key_value = outputs.get('ApiKeyValue', '')
+
+        # These lookups are independent of each other and of Steps 5-10,
+        # so start them all now and collect each result where it is needed.
+        url_future = LOOKUP_POOL.submit(
+            get_connect_instance_url, session, args.connect_instance_id,
+        )
+        assistant_future = LOOKUP_POOL.submit(
+            find_qconnect_assistant, session, args.connect_instance_id,
+        )
+        api_key_future = None
+        if not api_key_value:
+            api_key_future = LOOKUP_POOL.submit(
+                get_api_key_value, get_client(session, 'apigateway'), api_key_id,
+            )
+
+        # Once the assistant is known, list its prompts and agents while the
+        # MCP + Connect steps run, so Steps 11-12 find them already indexed.
+        def prefetch_indexes(future):
+            # The main thread reports a failed lookup when it reads the result
+            if future.exception():
+                return
+            assistant_id, _ = future.result()
+            if assistant_id:
+                prefetch_ai_name_indexes(get_client(session, 'qconnect'), assistant_id)
+
+        assistant_future.add_done_callback(prefetch_indexes)
+
         logger.info('Connect-only mode: skipping CFN/Lambda/KB steps')
         logger.info('API URL:     %s', api_url)
         logger.info('Gateway:     %s', gateway_id)
         # Jump to MCP steps (5-7) + Connect steps (8-13)
-        agentcore_client = session.client('bedrock-agentcore-control')
+        agentcore_client = get_client(session, 'bedrock-agentcore-control')
         logger.info('')
         logger.info('--- Step 5: OpenAPI spec (always re-upload from local) ---')
-        s3_client = session.client('s3')
+        s3_client = get_client(session, 's3')
         openapi_uri = upload_openapi_spec(s3_client, spec_bucket, api_url)
         logger.info('OpenAPI URI: %s', openapi_uri)
         logger.info('')
         logger.info('--- Step 6: Register API key credential ---')
-        api_key_value = outputs.get('ApiKeyValue', '')
-        if not api_key_value:
-            apigw_client = session.client('apigateway')
-            api_key_value = get_api_key_value(apigw_client, api_key_id)
+        if api_key_future:
+            api_key_value = api_key_future.result()
         cred_arn = register_api_key_credential(
-            agentcore_client, API_KEY_CREDENTIAL_NAME, api_key_value,
+            agentcore_client, names.api_key_credential, api_key_value,
         )
         logger.info('')
         logger.info('--- Step 7: Create MCP REST API target ---')
         target_id = create_or_update_mcp_target(
-            agentcore_client, gateway_id, MCP_TARGET_NAME,
+            agentcore_client, gateway_id, names.mcp_target,
             openapi_uri, cred_arn,
         )
-        connect_client = session.client('connect')
+        connect_client = get_client(session, 'connect')
         gateway_url = outputs.get('McpGatewayUrl', '')
         logger.info('')
         logger.info('--- Step 8: Update gateway AllowedAudience ---')
-        update_gateway_audience(session, gateway_id, connect_instance_url)
+        update_gateway_audience(session, gateway_id, url_future.result())
         logger.info('')
         logger.info('--- Step 9: Register MCP with Connect ---')
         register_mcp_with_connect(
             session, args.connect_instance_id, gateway_url,
-            gateway_id, args.stack_name,
+            gateway_id, names.mcp_app,
         )
         logger.info('')
         logger.info('--- Step 10: Create security profile ---')
         sp_id = find_or_create_security_profile(
-            connect_client, args.connect_instance_id,
+            connect_client, args.connect_instance_id, names.security_profile,
         )
         if sp_id and gateway_id:
             update_security_profile_tools(
                 connect_client, args.connect_instance_id, sp_id,
-                gateway_id, MCP_TOOL_NAMES,
+                gateway_id, names.mcp_tool_names, names.security_profile,
             )
         logger.info('')
         logger.info('--- Step 11: Create orchestration prompt ---')
-        assistant_id, _ = find_qconnect_assistant(session, args.connect_instance_id)
-        qconnect_client = session.client('qconnect')
+        assistant_id, _ = assistant_future.result()
+        qconnect_client = get_client(session, 'qconnect')
         prompt_id = None
         if assistant_id:
             prompt_id = create_or_update_orchestration_prompt(
-                session, assistant_id, ORCHESTRATION_PROMPT_NAME,
+                session, assistant_id, names.orchestration_prompt,
                 ORCHESTRATION_PROMPT_FILE, args.model_id,
             )
 
@@ -1908,18 +2510,19 @@ def main():
         agent_id = None
         if assistant_id and prompt_id:
             agent_id = create_ai_agent(
-                session, assistant_id, AI_AGENT_NAME, AI_AGENT_DESCRIPTION,
+                session, assistant_id, names.ai_agent, names.ai_agent_description,
                 args.connect_instance_id,
                 custom_prompt_id=prompt_id,
                 gateway_id=gateway_id,
                 set_default=args.set_default,
+                mcp_target_name=names.mcp_target,
             )
 
         logger.info('')
         logger.info('--- Step 13: Generate MCP tool config ---')
         if gateway_id and agent_id and assistant_id:
             generate_tool_config_file(
-                gateway_id, MCP_TARGET_NAME, AI_AGENT_NAME,
+                gateway_id, names.mcp_target, names.ai_agent,
                 agent_id, assistant_id, MCP_TOOL_CONFIG_FILE,
             )
 
@@ -1948,17 +2551,8 @@ def main():
     connect_instance_url = ''
     if args.connect_instance_id:
         args.enable_mcp = True
-        try:
-            connect_client = session.client('connect')
-            resp = connect_client.describe_instance(InstanceId=args.connect_instance_id)
-            connect_instance_url = resp['Instance'].get('InstanceAccessUrl', '')
-            if not connect_instance_url:
-                region = args.region
-                connect_instance_url = f'https://{args.connect_instance_id}.my.connect.aws'
-            logger.info('Connect instance URL: %s', connect_instance_url)
-        except Exception as e:
-            logger.warning('Could not describe Connect instance: %s', e)
-            connect_instance_url = f'https://{args.connect_instance_id}.my.connect.aws'
+        connect_instance_url = get_connect_instance_url(session, args.connect_instance_id)
+        logger.info('Connect instance URL: %s', connect_instance_url)
 
     # --- Step 1: Deploy CloudFormation stack ---
     logger.info('')
@@ -1971,16 +2565,15 @@ def main():
     openapi_spec_url = args.openapi_spec_url if hasattr(args, 'openapi_spec_url') and args.openapi_spec_url else ''
     if not openapi_spec_url and os.path.isfile(OPENAPI_SPEC_TEMPLATE):
         # Pre-upload the spec template to S3 so CFN custom resource can fetch it
-        s3_client = session.client('s3')
-        spec_bucket_name = f'{args.stack_name}-specs-{args.region}-{session.client("sts").get_caller_identity()["Account"]}'
+        s3_client = get_client(session, 's3')
+        spec_bucket_name = f'{args.stack_name}-specs-{args.region}-{get_account_id(session)}'
         try:
-            with open(OPENAPI_SPEC_TEMPLATE, 'r') as sf:
-                spec_body = sf.read()
-            s3_client.put_object(
+            s3_client.upload_file(
+                Filename=OPENAPI_SPEC_TEMPLATE,
                 Bucket=spec_bucket_name,
                 Key='openapi/actions-spec-template.yaml',
-                Body=spec_body.encode('utf-8'),
-                ContentType='application/x-yaml',
+                ExtraArgs={'ContentType': 'application/x-yaml'},
+                Config=SPEC_TRANSFER_CONFIG,
             )
             openapi_spec_url = f's3://{spec_bucket_name}/openapi/actions-spec-template.yaml'
             logger.info('Pre-uploaded spec template to %s', openapi_spec_url)
@@ -1995,11 +2588,13 @@ def main():
         connect_instance_id=args.connect_instance_id,
         connect_instance_url=connect_instance_url,
         openapi_spec_url=openapi_spec_url,
+        stack_timeout=args.stack_timeout,
     )
 
     if action in ('CREATE', 'UPDATE'):
         target_status = 'CREATE_COMPLETE' if action == 'CREATE' else 'UPDATE_COMPLETE'
-        final_status = wait_for_stack(cf_client, args.stack_name, target=target_status)
+        final_status = wait_for_stack(cf_client, args.stack_name, target=target_status,
+                                      timeout=args.stack_timeout)
         if final_status != target_status:
             logger.error('Stack ended with status: %s', final_status)
             sys.exit(1)
@@ -2023,45 +2618,76 @@ def main():
         redeploy_api_gateway(session, api_id, args.environment)
 
     # --- Step 3: Update Lambda code ---
+    # The spec upload, API key read, assistant lookup and security profile
+    # lookup do not depend on the Lambda update or on each other, so they run
+    # in the background while the code is packaged and pushed. The profile
+    # lookup is read-only; creating it stays at Step 10.
+    mcp_enabled = args.enable_mcp or args.connect_instance_id
+    lambda_client = get_client(session, 'lambda')
+    spec_future = api_key_future = assistant_future = sp_future = None
+    api_key_value = outputs.get('ApiKeyValue', '')
+    if mcp_enabled:
+        spec_future = LOOKUP_POOL.submit(
+            upload_openapi_spec, get_client(session, 's3'), spec_bucket, api_url,
+        )
+        if not api_key_value:
+            api_key_future = LOOKUP_POOL.submit(
+                get_api_key_value, get_client(session, 'apigateway'), api_key_id,
+            )
+    if args.connect_instance_id:
+        assistant_future = LOOKUP_POOL.submit(
+            find_qconnect_assistant, session, args.connect_instance_id,
+        )
+        sp_future = LOOKUP_POOL.submit(
+            find_security_profile_id, get_client(session, 'connect'),
+            args.connect_instance_id, names.security_profile,
+        )
+
+        def prefetch_indexes(future):
+            # The main thread reports a failed lookup when it reads the result
+            if future.exception():
+                return
+            assistant_id, _ = future.result()
+            if assistant_id:
+                prefetch_ai_name_indexes(get_client(session, 'qconnect'), assistant_id)
+
+        assistant_future.add_done_callback(prefetch_indexes)
+
     logger.info('')
     logger.info('--- Step 3: Update Lambda code ---')
-    lambda_client = session.client('lambda')
     update_lambda_code(lambda_client, actions_function, LAMBDA_CODE_DIR)
 
     # --- MCP Steps (5-7) ---
-    if args.enable_mcp or args.connect_instance_id:
-        agentcore_client = session.client('bedrock-agentcore-control')
+    if mcp_enabled:
+        agentcore_client = get_client(session, 'bedrock-agentcore-control')
 
         # Step 5: OpenAPI spec — always upload latest from local file
         logger.info('')
         logger.info('--- Step 5: OpenAPI spec ---')
-        s3_client = session.client('s3')
-        openapi_uri = upload_openapi_spec(s3_client, spec_bucket, api_url)
+        openapi_uri = spec_future.result()
         logger.info('OpenAPI URI: %s', openapi_uri)
 
         # Step 6: Register API key credential
         logger.info('')
         logger.info('--- Step 6: Register API key credential ---')
-        api_key_value = outputs.get('ApiKeyValue', '')
-        if not api_key_value:
+        if api_key_future:
             logger.info('ApiKeyValue not in CFN outputs — retrieving from API Gateway...')
-            apigw_client = session.client('apigateway')
-            api_key_value = get_api_key_value(apigw_client, api_key_id)
+            api_key_value = api_key_future.result()
         cred_arn = register_api_key_credential(
-            agentcore_client, API_KEY_CREDENTIAL_NAME, api_key_value,
+            agentcore_client, names.api_key_credential, api_key_value,
         )
 
         # Step 7: Create MCP REST API target
         logger.info('')
         logger.info('--- Step 7: Create MCP REST API target ---')
         target_id = create_or_update_mcp_target(
-            agentcore_client, gateway_id, MCP_TARGET_NAME,
+            agentcore_client, gateway_id, names.mcp_target,
             openapi_uri, cred_arn,
         )
 
     # --- Connect Steps (8-13) ---
     if args.connect_instance_id:
-        connect_client = session.client('connect')
+        connect_client = get_client(session, 'connect')
         gateway_url = outputs.get('McpGatewayUrl', '')
 
         # Step 8: Update gateway AllowedAudience
@@ -2074,30 +2700,33 @@ def main():
         logger.info('--- Step 9: Register MCP with Connect ---')
         register_mcp_with_connect(
             session, args.connect_instance_id, gateway_url,
-            gateway_id, args.stack_name,
+            gateway_id, names.mcp_app,
         )
 
         # Step 10: Create/update security profile
         logger.info('')
         logger.info('--- Step 10: Create security profile ---')
+        # Let the background lookup finish so its cached result is reused; if
+        # it failed, find_or_create_security_profile looks it up again
+        sp_future.exception()
         sp_id = find_or_create_security_profile(
-            connect_client, args.connect_instance_id,
+            connect_client, args.connect_instance_id, names.security_profile,
         )
         if sp_id and gateway_id:
             update_security_profile_tools(
                 connect_client, args.connect_instance_id, sp_id,
-                gateway_id, MCP_TOOL_NAMES,
+                gateway_id, names.mcp_tool_names, names.security_profile,
             )
 
         # Step 11: Create orchestration prompt
         logger.info('')
         logger.info('--- Step 11: Create orchestration prompt ---')
-        assistant_id, _ = find_qconnect_assistant(session, args.connect_instance_id)
-        qconnect_client = session.client('qconnect')
+        assistant_id, _ = assistant_future.result()
+        qconnect_client = get_client(session, 'qconnect')
         prompt_id = None
         if assistant_id:
             prompt_id = create_or_update_orchestration_prompt(
-                session, assistant_id, ORCHESTRATION_PROMPT_NAME,
+                session, assistant_id, names.orchestration_prompt,
                 ORCHESTRATION_PROMPT_FILE, args.model_id,
             )
         else:
@@ -2110,11 +2739,12 @@ def main():
         agent_id = None
         if assistant_id and prompt_id:
             agent_id = create_ai_agent(
-                session, assistant_id, AI_AGENT_NAME, AI_AGENT_DESCRIPTION,
+                session, assistant_id, names.ai_agent, names.ai_agent_description,
                 args.connect_instance_id,
                 custom_prompt_id=prompt_id,
                 gateway_id=gateway_id,
                 set_default=args.set_default,
+                mcp_target_name=names.mcp_target,
             )
 
         # Step 13: Generate tool config reference
@@ -2122,7 +2752,7 @@ def main():
         logger.info('--- Step 13: Generate MCP tool config ---')
         if gateway_id and agent_id and assistant_id:
             generate_tool_config_file(
-                gateway_id, MCP_TARGET_NAME, AI_AGENT_NAME,
+                gateway_id, names.mcp_target, names.ai_agent,
                 agent_id, assistant_id, MCP_TOOL_CONFIG_FILE,
             )
 
@@ -2144,12 +2774,12 @@ def main():
     logger.info('DynamoDB:        %s', outputs.get('ActionsTableName', ''))
     if gateway_id:
         logger.info('MCP Gateway:     %s', gateway_id)
-        logger.info('MCP Target:      %s', MCP_TARGET_NAME)
+        logger.info('MCP Target:      %s', names.mcp_target)
         logger.info('Tools:           %s', ', '.join(MCP_TOOL_OPERATIONS))
     if args.connect_instance_id:
         logger.info('Connect:         %s', args.connect_instance_id)
-        logger.info('Agent:           %s', AI_AGENT_NAME)
-        logger.info('Security Profile:%s', SECURITY_PROFILE_NAME)
+        logger.info('Agent:           %s', names.ai_agent)
+        logger.info('Security Profile:%s', names.security_profile)
 
     logger.info('')
     logger.info('Test endpoint:')
@@ -9,6 +9,10 @@ import json
 import logging
 import os
 import re
+import threading
+
+import boto3
+from botocore.config import Config
 
 # ---------------------------------------------------------------------------
 # Environment
@@ -21,6 +25,35 @@ CONNECT_INSTANCE_ID = os.environ.get('CONNECT_INSTANCE_ID', '')
 CONNECT_REGION = os.environ.get('CONNECT_REGION', os.environ.get('AWS_REGION', 'us-west-2'))
 RESULTS_BUCKET = os.environ.get('RESULTS_BUCKET_NAME', '')
 
+# ---------------------------------------------------------------------------
+# AWS clients (created once per container, reused across invocations)
+# ---------------------------------------------------------------------------
+
+# Keep connections alive between warm invocations; fail fast on retries
+BOTO_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={'mode': 'standard', 'max_attempts': 3},
+)
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(service, region_name=CONNECT_REGION):
+    """Return a shared boto3 client for service (region None = Lambda default)."""
+    key = (service, region_name)
+    client = _clients.get(key)
+    if client is None:
+        # boto3's default session is not safe to create clients from concurrently
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = boto3.client(
+                    service, region_name=region_name, config=BOTO_CONFIG,
+                )
+    return client
+
 # ---------------------------------------------------------------------------
 # Regex
 # ---------------------------------------------------------------------------
@@ -6,11 +6,10 @@ after every successful tool call. Also derives eligibility flags from
 caller demographics.
 """
 
-import boto3
 from botocore.exceptions import ClientError
 
 from config import (
-    ATTR_MAP, CONNECT_INSTANCE_ID, CONNECT_REGION, UUID_RE, get_logger,
+    ATTR_MAP, CONNECT_INSTANCE_ID, UUID_RE, get_client, get_logger,
 )
 
 logger = get_logger('contact_attributes')
@@ -101,7 +100,7 @@ def save_contact_attributes(body, result, request_id):
     )
 
     try:
-        connect_client = boto3.client('connect', region_name=CONNECT_REGION)
+        connect_client = get_client('connect')
         connect_client.update_contact_attributes(
             InstanceId=instance_id,
             InitialContactId=contact_id,
@@ -135,7 +134,7 @@ def save_extra_attributes(body, attributes):
     if not instance_id or not contact_id:
         return
     try:
-        connect_client = boto3.client('connect', region_name=CONNECT_REGION)
+        connect_client = get_client('connect')
         connect_client.update_contact_attributes(
             InstanceId=instance_id,
             InitialContactId=contact_id,
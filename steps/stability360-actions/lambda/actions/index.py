@@ -21,9 +21,7 @@ Modules:
 import json
 import os
 
-import boto3
-
-from config import RESULTS_BUCKET, get_logger
+from config import RESULTS_BUCKET, get_client, get_logger
 from contact_attributes import save_contact_attributes
 from auto_scoring import handle_resource_with_autoscore
 from intake_helper import handle_intake_helper
@@ -54,6 +52,8 @@ ACTION_ROUTES = {
     'intake_helper': handle_intake_helper,
 }
 
+ROUTE_TABLES = {'path': PATH_ROUTES, 'tool': TOOL_ROUTES, 'action': ACTION_ROUTES}
+
 # ---------------------------------------------------------------------------
 # Request parsing
 # ---------------------------------------------------------------------------
@@ -94,8 +94,7 @@ def _extract_route_and_body(event):
 
 def _resolve_handler(route_type, route_key):
     """Resolve the handler function from route tables."""
-    tables = {'path': PATH_ROUTES, 'tool': TOOL_ROUTES, 'action': ACTION_ROUTES}
-    return tables.get(route_type, {}).get(route_key)
+    return ROUTE_TABLES.get(route_type, {}).get(route_key)
 
 
 # ---------------------------------------------------------------------------
@@ -135,7 +134,7 @@ def _handle_results_redirect(event):
 
     s3_key = f'results/{page_id}.html'
     try:
-        s3 = boto3.client('s3')
+        s3 = get_client('s3', region_name=None)
         s3.head_object(Bucket=RESULTS_BUCKET, Key=s3_key)
         presigned = s3.generate_presigned_url(
             'get_object',
@@ -226,18 +225,16 @@ def handler(event, context):
             if automation_attrs:
                 result.update(automation_attrs)
 
-        # Propagate session attributes
+        # Propagate session attributes — moved to the end of the body so it is
+        # serialized once, instead of dumped, re-parsed and dumped again
         session_attrs = result.pop('sessionAttributes', None)
-        response = _response(200, result)
         if session_attrs:
-            response_body = json.loads(response['body'])
-            response_body['sessionAttributes'] = session_attrs
-            response['body'] = json.dumps(response_body, default=str)
+            result['sessionAttributes'] = session_attrs
             logger.info(
                 'Session attributes included in response',
                 extra={'extra': {'requestId': request_id, 'attrs': list(session_attrs.keys())}},
             )
-        return response
+        return _response(200, result)
 
     except ValueError as e:
         logger.warning('Validation error: %s', e)
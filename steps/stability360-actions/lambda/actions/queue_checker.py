@@ -12,7 +12,7 @@ Used by intake_helper to:
 import logging
 import os
 
-import boto3
+from config import get_client
 
 logger = logging.getLogger('queue_checker')
 
@@ -51,7 +51,7 @@ def check_queue_availability(instance_id=None):
     queue_id = _extract_queue_id(queue_arn)
 
     try:
-        connect = boto3.client('connect', region_name=CONNECT_REGION)
+        connect = get_client('connect', region_name=CONNECT_REGION)
         resp = connect.get_current_metric_data(
             InstanceId=instance_id,
             Filters={'Queues': [queue_id], 'Channels': ['CHAT']},
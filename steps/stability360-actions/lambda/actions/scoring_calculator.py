@@ -14,7 +14,6 @@ import json
 import os
 import uuid
 import logging
-from datetime import datetime, timezone
 
 logger = logging.getLogger('scoring_calculator')
 
@@ -52,6 +51,9 @@ EMPLOYMENT_STATUS_BASE = {
     'full_time_above_standard': 5,
 }
 
+# Housing challenges that escalate priority on their own
+PRIORITY_CHALLENGES = frozenset({'eviction_notice', 'shutoff_notice', 'homeless'})
+
 FICO_RANGES = {
     'below_580': -1,
     '580-669': -0.5,
@@ -101,11 +103,10 @@ def _score_housing(data):
         ratio_adj = 1
 
     # Challenges adjustment (-0.5 each, max -2)
-    priority_challenges = {'eviction_notice', 'shutoff_notice', 'homeless'}
     challenge_adj = -0.5 * min(len(challenges), 4)
 
     # Priority escalation: shutoff within 72 hours or eviction notice
-    priority = bool(set(challenges) & priority_challenges) or situation == 'homeless'
+    priority = not PRIORITY_CHALLENGES.isdisjoint(challenges) or situation == 'homeless'
 
     raw = base + ratio_adj + challenge_adj
     score = _clamp(raw)
@@ -284,7 +285,6 @@ def handle_scoring(body):
     composite, priority, path = _compute_composite(housing, employment, financial)
 
     record_id = str(uuid.uuid4())
-    timestamp = datetime.now(timezone.utc).isoformat()
 
     h_label = _score_label(housing['score'])
     e_label = _score_label(employment['score'])
@@ -317,12 +317,14 @@ def handle_scoring(body):
         ),
     }
 
-    # Store full details in DynamoDB (not returned to agent to keep payload small)
-    logger.info(
-        'Scoring details: housing=%s, employment=%s, financial=%s',
-        json.dumps(housing, default=str),
-        json.dumps(employment, default=str),
-        json.dumps(financial, default=str),
-    )
+    # Log full details (not returned to agent to keep payload small); only
+    # serialize them when INFO logging is actually enabled
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            'Scoring details: housing=%s, employment=%s, financial=%s',
+            json.dumps(housing, default=str),
+            json.dumps(employment, default=str),
+            json.dumps(financial, default=str),
+        )
 
     return result
@@ -13,12 +13,15 @@ import math
 import os
 import re
 import logging
+import time
 import uuid
 from html import escape as html_escape
+from string import Template
 
-import boto3
 import urllib3
 
+from config import get_client
+
 logger = logging.getLogger('sophia_resource_lookup')
 
 SOPHIA_API_URL = os.environ.get(
@@ -32,15 +35,77 @@ RESULTS_BUCKET = os.environ.get('RESULTS_BUCKET_NAME', '')
 API_BASE_URL = os.environ.get('API_BASE_URL', '')
 PRESIGNED_URL_EXPIRY = 86400  # 24 hours
 
+SOPHIA_HEADERS = {
+    'Accept': 'application/json',
+    'Content-Type': 'application/json',
+    'Tenant': SOPHIA_TENANT,
+    'Origin': SOPHIA_ORIGIN,
+}
+
 http = urllib3.PoolManager()
-_s3_client = None
 
+# Retry throttled/unavailable searches a couple of times with short
+# exponential backoff (the search is read-only, so POST is safe to repeat).
+# Read timeouts are not retried — the read budget already dominates.
+SOPHIA_RETRY = urllib3.Retry(
+    total=2,
+    connect=1,
+    read=0,
+    status=2,
+    status_forcelist=(429, 503),
+    allowed_methods=frozenset({'POST'}),
+    backoff_factor=0.5,
+    respect_retry_after_header=False,
+    raise_on_status=False,
+)
+# All attempts share one deadline, well under the ActionsFunction's 30s
+# timeout, so a slow 429/503 plus a retry still ends in the graceful
+# "unavailable" answer instead of a Lambda timeout.
+SOPHIA_DEADLINE_SECONDS = float(os.environ.get('SOPHIA_DEADLINE_SECONDS', '20'))
+SOPHIA_CONNECT_TIMEOUT = 5.0
+SOPHIA_MIN_ATTEMPT_SECONDS = 2.0
 
-def _get_s3_client():
-    global _s3_client
-    if _s3_client is None:
-        _s3_client = boto3.client('s3')
-    return _s3_client
+
+def _post_search(body_bytes):
+    """POST a search to Sophia, applying SOPHIA_RETRY within one overall deadline.
+
+    Each attempt's read timeout is whatever is left of the deadline; a retry
+    that would not get at least SOPHIA_MIN_ATTEMPT_SECONDS is skipped and the
+    last response (or error) is returned to the caller.
+    """
+    deadline = time.monotonic() + SOPHIA_DEADLINE_SECONDS
+    retries = SOPHIA_RETRY
+    while True:
+        remaining = deadline - time.monotonic()
+        try:
+            resp = http.request(
+                'POST',
+                SOPHIA_API_URL,
+                body=body_bytes,
+                headers=SOPHIA_HEADERS,
+                timeout=urllib3.Timeout(
+                    connect=min(SOPHIA_CONNECT_TIMEOUT, remaining), read=remaining,
+                ),
+                retries=False,
+            )
+        except urllib3.exceptions.HTTPError as e:
+            # Raises once the error is not retryable or retries are exhausted
+            retries = retries.increment('POST', SOPHIA_API_URL, error=e)
+            resp = None
+        else:
+            if not retries.is_retry('POST', resp.status):
+                return resp
+            try:
+                retries = retries.increment('POST', SOPHIA_API_URL, response=resp)
+            except urllib3.exceptions.MaxRetryError:
+                return resp
+
+        backoff = retries.get_backoff_time()
+        if deadline - time.monotonic() - backoff < SOPHIA_MIN_ATTEMPT_SECONDS:
+            if resp is not None:
+                return resp
+            raise urllib3.exceptions.MaxRetryError(None, SOPHIA_API_URL, 'deadline exceeded')
+        time.sleep(backoff)
 
 # ---------------------------------------------------------------------------
 # Tri-county ZIP code coordinates (Berkeley, Charleston, Dorchester)
@@ -314,14 +379,67 @@ def _parse_results(raw_results, max_results=None, user_coords=None):
 # HTML results page + presigned URL
 # ---------------------------------------------------------------------------
 
+# Values that can only contain HTML-safe characters are used as-is; anything
+# else falls back to html_escape
+SAFE_ZIP_RE = re.compile(r'\d{5}(-\d{4})?')
+SAFE_TEL_RE = re.compile(r'[\d+\-().]+')
+
+
+def _escape_unless(pattern, value):
+    """Skip escaping for values fully matching a safe-character pattern."""
+    value = str(value)
+    return value if pattern.fullmatch(value) else html_escape(value)
+
+
+# Static page shell, parsed once at import; only the keyword, location and
+# result cards are substituted per page
+RESULTS_PAGE_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Resources for ${keyword}${location} — Stability360</title>
+<style>
+  * { margin:0; padding:0; box-sizing:border-box; }
+  body { font-family:-apple-system,system-ui,sans-serif; background:#f5f5f5; color:#333; padding:16px; }
+  .header { background:#1a5276; color:#fff; padding:20px; border-radius:8px; margin-bottom:16px; text-align:center; }
+  .header h1 { font-size:20px; margin-bottom:4px; }
+  .header p { font-size:14px; opacity:0.85; }
+  .card { background:#fff; border-radius:8px; padding:16px; margin-bottom:12px; box-shadow:0 1px 3px rgba(0,0,0,0.1); }
+  .card h3 { font-size:16px; color:#1a5276; margin-bottom:8px; }
+  .card p { font-size:14px; margin-bottom:4px; line-height:1.4; }
+  .card .addr { color:#555; }
+  .card .phone a { color:#1a5276; text-decoration:none; font-weight:600; }
+  .card .web a { color:#2980b9; word-break:break-all; }
+  .card .desc { color:#666; font-size:13px; }
+  .card .elig { color:#777; font-size:13px; }
+  .footer { text-align:center; font-size:12px; color:#888; margin-top:20px; padding:12px; }
+  .footer a { color:#2980b9; }
+</style>
+</head>
+<body>
+<div class="header">
+  <h1>Community Resources</h1>
+  <p>Results for &ldquo;${keyword}&rdquo;${location}</p>
+</div>
+${cards}
+<div class="footer">
+  Stability360 by Trident United Way<br>
+  This link expires in 24 hours.
+</div>
+</body>
+</html>""")
+
 
 def _build_results_html(keyword, parsed_results, zip_code=''):
     """Build a mobile-friendly HTML page showing all results."""
-    location_label = f' near {zip_code}' if zip_code else ''
-    cards_html = []
+    location_label = f' near {_escape_unless(SAFE_ZIP_RE, zip_code)}' if zip_code else ''
+    keyword_html = html_escape(keyword)
+    # All cards go into one flat fragment list, joined once at the end
+    parts = []
     for i, r in enumerate(parsed_results, 1):
         name = html_escape(r.get('service_name', 'Unknown'))
-        parts = [f'<h3>{i}. {name}</h3>']
+        parts.append(f'<div class="card"><h3>{i}. {name}</h3>')
         if r.get('address'):
             dist = f' &mdash; {r["distance_miles"]} mi' if r.get('distance_miles') else ''
             parts.append(f'<p class="addr">{html_escape(r["address"])}{dist}</p>')
@@ -329,7 +447,10 @@ def _build_results_html(keyword, parsed_results, zip_code=''):
             phone = r['phones'][0]
             # Extract just the number for tel: link
             num = phone.split(' ')[0] if ' ' in phone else phone
-            parts.append(f'<p class="phone"><a href="tel:{num}">{html_escape(phone)}</a></p>')
+            parts.append(
+                f'<p class="phone"><a href="tel:{_escape_unless(SAFE_TEL_RE, num)}">'
+                f'{html_escape(phone)}</a></p>'
+            )
         if r.get('url'):
             url = r['url']
             parts.append(f'<p class="web"><a href="{html_escape(url)}" target="_blank">{html_escape(url)}</a></p>')
@@ -337,44 +458,11 @@ def _build_results_html(keyword, parsed_results, zip_code=''):
             parts.append(f'<p class="desc">{html_escape(r["description"])}</p>')
         if r.get('eligibility'):
             parts.append(f'<p class="elig"><strong>Eligibility:</strong> {html_escape(r["eligibility"][:200])}</p>')
-        cards_html.append(f'<div class="card">{"".join(parts)}</div>')
+        parts.append('</div>')
 
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="utf-8">
-<meta name="viewport" content="width=device-width, initial-scale=1">
-<title>Resources for {html_escape(keyword)}{location_label} — Stability360</title>
-<style>
-  * {{ margin:0; padding:0; box-sizing:border-box; }}
-  body {{ font-family:-apple-system,system-ui,sans-serif; background:#f5f5f5; color:#333; padding:16px; }}
-  .header {{ background:#1a5276; color:#fff; padding:20px; border-radius:8px; margin-bottom:16px; text-align:center; }}
-  .header h1 {{ font-size:20px; margin-bottom:4px; }}
-  .header p {{ font-size:14px; opacity:0.85; }}
-  .card {{ background:#fff; border-radius:8px; padding:16px; margin-bottom:12px; box-shadow:0 1px 3px rgba(0,0,0,0.1); }}
-  .card h3 {{ font-size:16px; color:#1a5276; margin-bottom:8px; }}
-  .card p {{ font-size:14px; margin-bottom:4px; line-height:1.4; }}
-  .card .addr {{ color:#555; }}
-  .card .phone a {{ color:#1a5276; text-decoration:none; font-weight:600; }}
-  .card .web a {{ color:#2980b9; word-break:break-all; }}
-  .card .desc {{ color:#666; font-size:13px; }}
-  .card .elig {{ color:#777; font-size:13px; }}
-  .footer {{ text-align:center; font-size:12px; color:#888; margin-top:20px; padding:12px; }}
-  .footer a {{ color:#2980b9; }}
-</style>
-</head>
-<body>
-<div class="header">
-  <h1>Community Resources</h1>
-  <p>Results for &ldquo;{html_escape(keyword)}&rdquo;{location_label}</p>
-</div>
-{"".join(cards_html)}
-<div class="footer">
-  Stability360 by Trident United Way<br>
-  This link expires in 24 hours.
-</div>
-</body>
-</html>"""
+    return RESULTS_PAGE_TEMPLATE.substitute(
+        keyword=keyword_html, location=location_label, cards=''.join(parts),
+    )
 
 
 def _upload_results_page(keyword, parsed_results, zip_code=''):
@@ -388,7 +476,7 @@ def _upload_results_page(keyword, parsed_results, zip_code=''):
     s3_key = f'results/{page_id}.html'
 
     try:
-        s3 = _get_s3_client()
+        s3 = get_client('s3', region_name=None)
         s3.put_object(
             Bucket=RESULTS_BUCKET,
             Key=s3_key,
@@ -451,22 +539,8 @@ def handle_resource_lookup(body):
     search_payload = _build_search_payload(keyword, county, city, zip_code, state)
     body_bytes = json.dumps(search_payload).encode('utf-8')
 
-    headers = {
-        'Accept': 'application/json',
-        'Content-Type': 'application/json',
-        'Tenant': SOPHIA_TENANT,
-        'Origin': SOPHIA_ORIGIN,
-    }
-
     try:
-        resp = http.request(
-            'POST',
-            SOPHIA_API_URL,
-            body=body_bytes,
-            headers=headers,
-            timeout=urllib3.Timeout(connect=5.0, read=25.0),
-            retries=False,
-        )
+        resp = _post_search(body_bytes)
 
         if resp.status != 200:
             logger.warning('Sophia API returned status %d', resp.status)
@@ -9,14 +9,17 @@ Handles post-disposition automation when a caller chooses 'callback' or 'live_tr
 All operations are silent — the caller never knows about profile/case creation.
 """
 
+import itertools
 import json
 import logging
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 
-import boto3
 from botocore.exceptions import ClientError
 
+from config import get_client
+
 logger = logging.getLogger('task_manager')
 
 # ---------------------------------------------------------------------------
@@ -32,12 +35,45 @@ CASE_TEMPLATE_ID = os.environ.get('CASE_TEMPLATE_ID', '')
 CONNECT_REGION = os.environ.get('CONNECT_REGION', os.environ.get('AWS_REGION', 'us-west-2'))
 CONNECT_INSTANCE_ID = os.environ.get('CONNECT_INSTANCE_ID', '')
 
+# (label, body key) pairs appended to the task description when present
+TASK_DESCRIPTION_FIELDS = (
+    ('ZIP', 'zipCode'), ('Contact', 'contactInfo'),
+    ('Employment', 'employmentStatus'), ('Employer', 'employer'),
+    ('Scoring', 'scoringSummary'),
+    ('Preferred days', 'preferredDays'), ('Preferred times', 'preferredTimes'),
+)
+
+# Body keys copied into task template references (needCategory is resolved)
+TASK_REFERENCE_KEYS = (
+    'firstName', 'lastName', 'zipCode',
+    'contactMethod', 'contactInfo', 'employmentStatus', 'employer',
+    'partnerEmployee', 'scoringSummary', 'preferredDays', 'preferredTimes',
+)
+
 UUID_RE = re.compile(
     r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
     re.IGNORECASE,
 )
 
 
+# Runs the email/name profile fallbacks concurrently, and the callback task
+# alongside the case
+_POOL = ThreadPoolExecutor(max_workers=2)
+# Account ID: set by deploy.py, else looked up via STS and kept once found
+_account_id = os.environ.get('ACCOUNT_ID') or None
+
+
+def _get_client(service):
+    return get_client(service, region_name=CONNECT_REGION)
+
+
+def _get_account_id():
+    global _account_id
+    if _account_id is None:
+        _account_id = _get_client('sts').get_caller_identity()['Account']
+    return _account_id
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -51,6 +87,18 @@ def _normalize_phone(phone):
     return '+' + digits
 
 
+def _join_capped(parts, max_len, sep='\n'):
+    """Join parts with sep, stopping once max_len characters are reached."""
+    out = []
+    size = 0
+    for part in parts:
+        out.append(part)
+        size += len(part) + len(sep)
+        if size >= max_len:
+            break
+    return sep.join(out)[:max_len]
+
+
 # ---------------------------------------------------------------------------
 # Customer Profile
 # ---------------------------------------------------------------------------
@@ -60,9 +108,9 @@ def find_or_create_customer_profile(body):
     """Search for an existing customer profile by phone/email/name, or create one.
 
     Multi-step search to handle duplicates:
-      1. Search by phone — if exactly 1 → use it
-      2. If 0 or multiple → search by email — if exactly 1 → use it
-      3. If still ambiguous → search by full name
+      1. Search by phone — if found → use it
+      2. Otherwise → search by email — if found → use it
+      3. Otherwise → search by full name (run alongside the email search)
       4. If multiple at any step → pick the most recent
       5. If no results → create new profile
 
@@ -85,7 +133,7 @@ def find_or_create_customer_profile(body):
         phone = _normalize_phone(phone)
 
     try:
-        profiles_client = boto3.client('customer-profiles', region_name=CONNECT_REGION)
+        profiles_client = _get_client('customer-profiles')
 
         # Step 1: Search by phone
         if phone:
@@ -93,16 +141,16 @@ def find_or_create_customer_profile(body):
             if profile_id:
                 return profile_id
 
-        # Step 2: Search by email
-        if email:
-            profile_id = _search_profiles(profiles_client, domain, '_email', email)
-            if profile_id:
-                return profile_id
-
-        # Step 3: Search by full name
+        # Steps 2-3: Phone missed — search by email and full name concurrently,
+        # preferring an email hit
         full_name = f'{first_name} {last_name}'.strip()
-        if full_name:
-            profile_id = _search_profiles(profiles_client, domain, '_fullName', full_name)
+        searches = [
+            _POOL.submit(_search_profiles, profiles_client, domain, key_name, value)
+            for key_name, value in (('_email', email), ('_fullName', full_name))
+            if value
+        ]
+        for future in searches:
+            profile_id = future.result()
             if profile_id:
                 return profile_id
 
@@ -181,36 +229,25 @@ def create_callback_task(body, instance_id, contact_id, profile_id=None):
 
     task_name = f'Callback: {first_name} {last_name} — {need_category}'[:512]
 
-    description_parts = [
-        f'Callback requested by {first_name} {last_name}',
-        f'Need: {need_category}',
-    ]
-    for label, key in [
-        ('ZIP', 'zipCode'), ('Contact', 'contactInfo'),
-        ('Employment', 'employmentStatus'), ('Employer', 'employer'),
-        ('Scoring', 'scoringSummary'),
-        ('Preferred days', 'preferredDays'), ('Preferred times', 'preferredTimes'),
-    ]:
-        val = body.get(key, '').strip()
-        if val:
-            description_parts.append(f'{label}: {val}')
-    task_description = '\n'.join(description_parts)[:4096]
+    # Lazily built so fields past the 4096-char limit are never formatted
+    task_description = _join_capped(itertools.chain(
+        (f'Callback requested by {first_name} {last_name}', f'Need: {need_category}'),
+        (
+            f'{label}: {val}'
+            for label, key in TASK_DESCRIPTION_FIELDS
+            if (val := body.get(key, '').strip())
+        ),
+    ), 4096)
 
     # Build references (task template fields)
-    references = {}
-    for key in [
-        'firstName', 'lastName', 'needCategory', 'zipCode',
-        'contactMethod', 'contactInfo', 'employmentStatus', 'employer',
-        'partnerEmployee', 'scoringSummary', 'preferredDays', 'preferredTimes',
-    ]:
+    references = {'needCategory': {'Value': str(need_category)[:4096], 'Type': 'STRING'}}
+    for key in TASK_REFERENCE_KEYS:
         val = body.get(key, '')
-        if key == 'needCategory':
-            val = need_category
         if val:
             references[key] = {'Value': str(val)[:4096], 'Type': 'STRING'}
 
     try:
-        connect_client = boto3.client('connect', region_name=CONNECT_REGION)
+        connect_client = _get_client('connect')
 
         task_kwargs = {
             'InstanceId': instance_id,
@@ -262,7 +299,7 @@ def create_case(body, instance_id, contact_id, profile_id=None):
     )
 
     try:
-        cases_client = boto3.client('connectcases', region_name=CONNECT_REGION)
+        cases_client = _get_client('connectcases')
 
         # Use the Stability360 case template (set by deploy.py)
         template_id = CASE_TEMPLATE_ID
@@ -278,8 +315,7 @@ def create_case(body, instance_id, contact_id, profile_id=None):
         if profile_id:
             # customer_id expects a full profile ARN
             domain = CUSTOMER_PROFILES_DOMAIN
-            sts = boto3.client('sts', region_name=CONNECT_REGION)
-            account = sts.get_caller_identity()['Account']
+            account = _get_account_id()
             profile_arn = (
                 f'arn:aws:profile:{CONNECT_REGION}:{account}'
                 f':domains/{domain}/profiles/{profile_id}'
@@ -328,8 +364,7 @@ def _build_contact_arn(instance_id, contact_id):
     region = CONNECT_REGION
     # Get account from instance ARN context, or use STS
     try:
-        sts = boto3.client('sts', region_name=region)
-        account = sts.get_caller_identity()['Account']
+        account = _get_account_id()
     except Exception:
         account = '*'
     return f'arn:aws:connect:{region}:{account}:instance/{instance_id}/contact/{contact_id}'
@@ -375,19 +410,24 @@ def handle_disposition_automation(body, result):
     else:
         extra_attrs['profileCreated'] = 'false'
 
-    # 2. Task (callback only)
+    # 2 + 3. Task (callback only) and case (all dispositions) only depend on
+    # the profile, so create them concurrently. Both are awaited — Lambda
+    # freezes the container once the handler returns.
+    task_future = None
     if disposition == 'callback':
         logger.info('Disposition automation: creating callback task...')
-        task_contact_id = create_callback_task(body, instance_id, contact_id, profile_id)
+        task_future = _POOL.submit(create_callback_task, body, instance_id, contact_id, profile_id)
+    logger.info('Disposition automation: creating case...')
+    case_id = create_case(body, instance_id, contact_id, profile_id)
+
+    if task_future:
+        task_contact_id = task_future.result()
         if task_contact_id:
             extra_attrs['taskCreated'] = 'true'
             extra_attrs['taskContactId'] = task_contact_id
         else:
             extra_attrs['taskCreated'] = 'false'
 
-    # 3. Case (both callback and live_transfer) — linked to contact + profile
-    logger.info('Disposition automation: creating case...')
-    case_id = create_case(body, instance_id, contact_id, profile_id)
     if case_id:
         extra_attrs['caseId'] = case_id
         extra_attrs['caseCreated'] = 'true'
@@ -397,7 +437,7 @@ def handle_disposition_automation(body, result):
     # Save extra attributes to the original contact
     if extra_attrs:
         try:
-            connect_client = boto3.client('connect', region_name=CONNECT_REGION)
+            connect_client = _get_client('connect')
             connect_client.update_contact_attributes(
                 InstanceId=instance_id,
                 InitialContactId=contact_id,
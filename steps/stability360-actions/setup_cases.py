@@ -214,10 +214,12 @@ def create_fields(cases_client, domain_id):
             field_map[name] = field_id
             logger.info('  Created field: %s (%s)', name, field_id)
         except cases_client.exceptions.ConflictException:
-            # Race condition — field was created between list and create
+            # Race condition — field was created between list and create.
+            # Refresh the cached map so later fields created by the same
+            # racer are found by the lookup above instead of re-listing.
             logger.info('  Field already exists (conflict): %s', name)
-            refreshed = get_existing_fields(cases_client, domain_id)
-            field_map[name] = refreshed.get(name, '')
+            existing = get_existing_fields(cases_client, domain_id)
+            field_map[name] = existing.get(name, '')
         except Exception as e:
             logger.error('  Failed to create field %s: %s', name, e)
             raise
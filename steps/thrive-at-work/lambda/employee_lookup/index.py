@@ -72,11 +72,17 @@ handler.setFormatter(StructuredFormatter())
 logger.addHandler(handler)
 
 # ---------------------------------------------------------------------------
-# DynamoDB client (initialized once per container)
+# DynamoDB table (created on first lookup, then reused per container)
 # ---------------------------------------------------------------------------
 
-dynamodb = boto3.resource('dynamodb')
-table = dynamodb.Table(TABLE_NAME)
+_table = None
+
+
+def _get_table():
+    global _table
+    if _table is None:
+        _table = boto3.resource('dynamodb').Table(TABLE_NAME)
+    return _table
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -195,7 +201,7 @@ def handler(event, context):
         )
 
         # --- DynamoDB lookup (GetItem by PK) ---
-        result = table.get_item(
+        result = _get_table().get_item(
             Key={'employee_id': employee_id},
             ConsistentRead=True,
         )